@@ -2,34 +2,251 @@
 """
 Flask Web Application for Sago Pitch Deck Verifier
 """
+import gzip
+import json
 import os
+import queue
+from collections import OrderedDict
+from threading import RLock, Condition, Thread
+import shutil
+import tempfile
+import time
 import uuid
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, render_template, request, jsonify, send_file, session, Response
 from werkzeug.utils import secure_filename
-import threading
 from pathlib import Path
 
 from src.agent import SagoPitchVerifier
 from src.models import InvestorProfile
 from src.config import config
 
+# Fail fast on bad LLM configuration at boot instead of per job
+config.validate()
+
 app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+
+# Serve jsonify responses through orjson when available; /status gets
+# polled continuously, so encoding speed matters
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+except ImportError:
+    pass
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
-app.config['UPLOAD_FOLDER'] = 'uploads'
-app.config['REPORTS_FOLDER'] = 'reports'
+
+
+def _transient_dir(env_var, name):
+    """
+    Pick a directory for transient job files. Uploads and reports are
+    short-lived and re-read several times (parser, WeasyPrint layout),
+    so prefer tmpfs (/dev/shm) to keep them out of disk I/O entirely;
+    fall back to the system temp dir elsewhere.
+    """
+    override = os.getenv(env_var)
+    if override:
+        return override
+    if os.path.isdir('/dev/shm'):
+        return os.path.join('/dev/shm', name)
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+app.config['UPLOAD_FOLDER'] = _transient_dir('UPLOAD_DIR', 'pitch_uploads')
+app.config['REPORTS_FOLDER'] = _transient_dir('REPORTS_DIR', 'pitch_reports')
 
 # Create necessary directories
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['REPORTS_FOLDER'], exist_ok=True)
 
-# Store analysis jobs
-jobs = {}
+# No shutdown cleanup of these dirs: they're shared by every gunicorn
+# and Celery worker process, so one process exiting must not delete
+# files others are still serving. tmpfs clears itself on reboot, and
+# LRU eviction unlinks per-job files as records age out.
+
+# Optional Celery + Redis backing for multi-worker deployments.
+# With a broker configured, analysis runs in Celery workers and job state
+# lives in Redis, so any gunicorn worker can answer /status/<job_id> and
+# jobs survive app restarts. Without one, we fall back to in-process
+# threads and an in-memory dict (single-worker dev mode).
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL') or os.getenv('REDIS_URL')
+REDIS_URL = os.getenv('REDIS_URL') or CELERY_BROKER_URL
+
+celery = None
+if CELERY_BROKER_URL:
+    try:
+        from celery import Celery
+        celery = Celery('pitch', broker=CELERY_BROKER_URL, backend=REDIS_URL)
+        print(f"✓ Celery task queue ready ({CELERY_BROKER_URL})")
+    except ImportError:
+        print("⚠ Celery not installed, falling back to in-process threads")
+        print("   Install with: pip install celery redis")
+
+_redis = None
+if REDIS_URL:
+    try:
+        import redis as redis_lib
+        _redis = redis_lib.Redis.from_url(REDIS_URL, decode_responses=True)
+        _redis.ping()
+        print(f"✓ Redis job store ready ({REDIS_URL})")
+    except ImportError:
+        print("⚠ redis-py not installed, using in-memory job store")
+        print("   Install with: pip install redis")
+    except Exception as e:
+        print(f"⚠ Redis connection failed: {e}, using in-memory job store")
+        _redis = None
+
+# Celery workers can only report progress through the shared Redis job
+# store; with the in-memory store each process has its own private dict
+# and /status would show 0% forever. So Celery dispatch requires both.
+if celery is not None and _redis is None:
+    print("⚠ Celery broker configured but no Redis job store; running analyses in-process")
+
+# Bounded worker pool for the no-broker fallback. A burst of uploads
+# queues here instead of spawning one heavy analysis thread each (every
+# analysis does PDF parsing plus dozens of LLM calls), which kept memory
+# and CPU unbounded under load. Daemon threads rather than a
+# ThreadPoolExecutor: executor threads are non-daemon and joined at
+# interpreter exit, which made Ctrl+C on the dev server hang until
+# every in-flight analysis (minutes each) finished.
+ANALYSIS_CONCURRENCY = int(os.getenv('ANALYSIS_CONCURRENCY', '4'))
+_analysis_queue = queue.Queue()
+
+
+def _analysis_worker():
+    while True:
+        func, args = _analysis_queue.get()
+        try:
+            func(*args)
+        except Exception:
+            import traceback
+            traceback.print_exc()
+        finally:
+            _analysis_queue.task_done()
+
+
+for _worker_num in range(ANALYSIS_CONCURRENCY):
+    Thread(target=_analysis_worker, daemon=True, name=f'analysis_{_worker_num}').start()
+
+# In-memory job store (fallback when Redis is not configured).
+# A bounded LRU rather than a plain dict: without eviction, every
+# finished job's paths/result/error strings stay resident for the life
+# of the process. Guarded by a lock since analysis threads and request
+# handlers touch it concurrently.
+jobs = OrderedDict()
+jobs_lock = RLock()
+MAX_IN_MEMORY_JOBS = int(os.getenv('MAX_IN_MEMORY_JOBS', '1000'))
+
+# Jobs expire from Redis a day after their last update
+JOB_TTL_SECONDS = 24 * 60 * 60
+
+# Per-job condition variables that wake SSE streams when state changes
+# (in-memory mode; with Redis the streams poll the store server-side).
+# Each entry is [Condition, refcount]: several streams can watch one
+# job, and the entry only goes away when the last of them lets go.
+_job_events = {}
+_job_events_lock = RLock()
+
+
+def _acquire_job_event(job_id):
+    """Get (creating if needed) a job's Condition and take a reference"""
+    with _job_events_lock:
+        entry = _job_events.get(job_id)
+        if entry is None:
+            entry = _job_events[job_id] = [Condition(), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_job_event(job_id):
+    """Drop one stream's reference; forget the entry once unused"""
+    with _job_events_lock:
+        entry = _job_events.get(job_id)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del _job_events[job_id]
+
+
+def _notify_job(job_id):
+    with _job_events_lock:
+        entry = _job_events.get(job_id)
+    if entry is not None:
+        cond = entry[0]
+        with cond:
+            cond.notify_all()
+
+
+def _job_key(job_id):
+    return f"pitch:job:{job_id}"
+
+
+def _remove_job_files(job):
+    """Delete an evicted job's transient files"""
+    result = job.get('result') or {}
+    html_path = result.get('html_path')
+    paths = [job.get('filepath'), result.get('report_path'), html_path]
+    if html_path:
+        paths.append(html_path + '.gz')
+    for path in paths:
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def save_job(job_id, job):
+    """Persist a full job record (Redis if configured, else in-memory)"""
+    if _redis is not None:
+        _redis.set(_job_key(job_id), json.dumps(job), ex=JOB_TTL_SECONDS)
+        return
+    with jobs_lock:
+        jobs[job_id] = job
+        jobs.move_to_end(job_id)
+        while len(jobs) > MAX_IN_MEMORY_JOBS:
+            _, evicted = jobs.popitem(last=False)
+            _remove_job_files(evicted)
+    _notify_job(job_id)
+
+
+def update_job(job_id, **fields):
+    """Update fields on an existing job record"""
+    with jobs_lock:
+        job = load_job(job_id)
+        if job is None:
+            return
+        job.update(fields)
+        save_job(job_id, job)
+
+
+def load_job(job_id):
+    """Fetch a job record, or None if unknown/evicted"""
+    if _redis is not None:
+        raw = _redis.get(_job_key(job_id))
+        return json.loads(raw) if raw else None
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is not None:
+            jobs.move_to_end(job_id)
+        return job
+
+
+# Accepted upload extensions (endswith takes a tuple directly)
+ALLOWED_EXTENSIONS = ('.pdf',)
 
 
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() == 'pdf'
+    return filename.lower().endswith(ALLOWED_EXTENSIONS)
 
 
 @app.route('/')
@@ -43,30 +260,38 @@ def upload_file():
     """Handle file upload and start analysis"""
     if 'file' not in request.files:
         return jsonify({'error': 'No file provided'}), 400
-    
+
     file = request.files['file']
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
-    
+
     if not allowed_file(file.filename):
         return jsonify({'error': 'Only PDF files are allowed'}), 400
-    
+
+    # Check PDF magic bytes before writing anything to disk
+    head = file.stream.read(5)
+    if head != b'%PDF-':
+        return jsonify({'error': 'File is not a valid PDF'}), 400
+
     # Generate unique job ID
     job_id = str(uuid.uuid4())
-    
-    # Save uploaded file
+
+    # Stream the upload to disk in 1 MiB chunks instead of buffering
+    # the whole (up to 16MB) body in memory
     filename = secure_filename(file.filename)
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], f"{job_id}_{filename}")
-    file.save(filepath)
-    
+    with open(filepath, 'wb', buffering=1 << 20) as f:
+        f.write(head)
+        shutil.copyfileobj(file.stream, f, length=1 << 20)
+
     # Get optional parameters
     email = request.form.get('email', '').strip()
     investor_name = request.form.get('investor_name', config.investor_name)
     focus_areas = request.form.get('focus_areas', config.investor_focus_areas)
     investment_stage = request.form.get('investment_stage', config.investment_stage)
-    
+
     # Initialize job status
-    jobs[job_id] = {
+    save_job(job_id, {
         'status': 'processing',
         'progress': 0,
         'message': 'Starting analysis...',
@@ -75,16 +300,17 @@ def upload_file():
         'email': email,
         'result': None,
         'error': None
-    }
-    
-    # Start analysis in background thread
-    thread = threading.Thread(
-        target=process_analysis,
-        args=(job_id, filepath, email, investor_name, focus_areas, investment_stage)
-    )
-    thread.daemon = True
-    thread.start()
-    
+    })
+
+    # Enqueue analysis: Celery worker if a broker is configured AND the
+    # Redis job store is up (workers can't publish progress without it),
+    # otherwise the bounded in-process pool
+    task_args = (job_id, filepath, email, investor_name, focus_areas, investment_stage)
+    if celery is not None and _redis is not None:
+        process_analysis_task.delay(*task_args)
+    else:
+        _analysis_queue.put((process_analysis, task_args))
+
     return jsonify({
         'job_id': job_id,
         'message': 'Analysis started'
@@ -94,130 +320,219 @@ def upload_file():
 def process_analysis(job_id, filepath, email, investor_name, focus_areas, investment_stage):
     """Process the pitch deck analysis in background"""
     try:
-        jobs[job_id]['progress'] = 10
-        jobs[job_id]['message'] = 'Initializing agent...'
-        
+        update_job(job_id, progress=10, message='Initializing agent...')
+
         # Create investor profile
         investor_profile = InvestorProfile(
             name=investor_name,
             focus_areas=focus_areas.split(',') if focus_areas else config.investor_focus_areas.split(', '),
             investment_stage=investment_stage
         )
-        
+
         # Initialize agent
         agent = SagoPitchVerifier(investor_profile=investor_profile)
-        
-        jobs[job_id]['progress'] = 20
-        jobs[job_id]['message'] = 'Analyzing pitch deck...'
-        
+
+        update_job(job_id, progress=20, message='Analyzing pitch deck...')
+
         # Run analysis
         analysis = agent.analyze(
             pdf_path=filepath,
             max_claims=25,
             max_questions=10
         )
-        
-        jobs[job_id]['progress'] = 80
-        jobs[job_id]['message'] = 'Generating report...'
-        
+
+        update_job(job_id, progress=80, message='Generating report...')
+
         # Generate report paths
         report_filename = f"{job_id}_report.pdf"
         report_path = os.path.join(app.config['REPORTS_FOLDER'], report_filename)
         html_path = os.path.join(app.config['REPORTS_FOLDER'], f"{job_id}_report.html")
-        
+
         # Save HTML report using the same method as PDF/email (full detailed report)
         agent._save_full_html_report(analysis, html_path)
-        
+
+        # Pre-compress the HTML once at generation time so /view can
+        # serve it without re-compressing per request. gzip rather than
+        # zstd: every browser accepts it in Accept-Encoding.
+        html_gz_exists = False
+        try:
+            with open(html_path, 'rb') as src, \
+                    gzip.open(html_path + '.gz', 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            html_gz_exists = True
+        except OSError as e:
+            print(f"Report compression error: {e}")
+
         # Generate PDF report from the same HTML
         try:
-            from weasyprint import HTML
-            HTML(html_path).write_pdf(report_path)
+            from src.report_renderer import write_pdf_report
+            write_pdf_report(html_path, report_path)
         except Exception as e:
             print(f"PDF generation error: {e}")
             report_path = None
-        
-        jobs[job_id]['progress'] = 100
-        jobs[job_id]['status'] = 'completed'
-        jobs[job_id]['message'] = 'Analysis complete!'
-        jobs[job_id]['result'] = {
+
+        # Record which files actually landed on disk once here, so the
+        # download/view routes don't have to stat per request
+        report_exists = bool(report_path and os.path.exists(report_path))
+        result = {
             'company_name': analysis.company_name,
             'verification_score': analysis.overall_verification_score,
             'num_claims': len(analysis.verified_claims),
             'num_questions': len(analysis.generated_questions),
-            'report_path': report_path if report_path and os.path.exists(report_path) else None,
-            'html_path': html_path
+            'report_path': report_path if report_exists else None,
+            'report_exists': report_exists,
+            'html_path': html_path,
+            'html_exists': os.path.exists(html_path),
+            'html_gz_exists': html_gz_exists
         }
-        
+
         # Send email if provided
         if email:
             try:
                 agent.send_via_email(analysis, email, analysis.company_name)
-                jobs[job_id]['result']['email_sent'] = True
+                result['email_sent'] = True
             except Exception as e:
-                jobs[job_id]['result']['email_sent'] = False
-                jobs[job_id]['result']['email_error'] = str(e)
-        
+                result['email_sent'] = False
+                result['email_error'] = str(e)
+
+        update_job(
+            job_id,
+            progress=100,
+            status='completed',
+            message='Analysis complete!',
+            result=result
+        )
+
     except Exception as e:
-        jobs[job_id]['status'] = 'error'
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['message'] = f'Error: {str(e)}'
+        update_job(job_id, status='error', error=str(e), message=f'Error: {str(e)}')
         import traceback
         traceback.print_exc()
 
 
+if celery is not None:
+    @celery.task(name='pitch.process_analysis')
+    def process_analysis_task(job_id, filepath, email, investor_name, focus_areas, investment_stage):
+        """Celery entry point; run with: celery -A app.celery worker"""
+        process_analysis(job_id, filepath, email, investor_name, focus_areas, investment_stage)
+
+
 @app.route('/status/<job_id>')
 def get_status(job_id):
     """Get analysis job status"""
-    if job_id not in jobs:
+    job = load_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
-    
-    job = jobs[job_id]
-    return jsonify({
+
+    return jsonify(_status_snapshot(job))
+
+
+def _status_snapshot(job):
+    """The public slice of a job record sent to status clients"""
+    return {
         'status': job['status'],
         'progress': job['progress'],
         'message': job['message'],
         'result': job.get('result'),
         'error': job.get('error')
-    })
+    }
+
+
+@app.route('/events/<job_id>')
+def job_events(job_id):
+    """
+    Stream job progress as Server-Sent Events.
+
+    Pushes one event per actual state change instead of making clients
+    poll /status. In-memory mode sleeps on a per-job Condition signaled
+    by save_job; with Redis the stream re-reads the key server-side.
+    """
+    if load_job(job_id) is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    cond = _acquire_job_event(job_id) if _redis is None else None
+
+    def stream():
+        last = None
+        # try/finally so a client disconnect (GeneratorExit at the
+        # yield) still releases this stream's reference
+        try:
+            while True:
+                job = load_job(job_id)
+                if job is None:
+                    break
+                snapshot = _status_snapshot(job)
+                if snapshot != last:
+                    last = snapshot
+                    yield f"data: {json.dumps(snapshot)}\n\n"
+                if job['status'] in ('completed', 'error'):
+                    break
+                if cond is not None:
+                    with cond:
+                        cond.wait(timeout=15)  # timeout doubles as a keepalive check
+                else:
+                    time.sleep(0.5)
+        finally:
+            if cond is not None:
+                _release_job_event(job_id)
+
+    return Response(
+        stream(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # don't let nginx buffer the stream
+        }
+    )
 
 
 @app.route('/download/<job_id>')
 def download_report(job_id):
     """Download the analysis report"""
-    if job_id not in jobs:
+    job = load_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
-    
-    job = jobs[job_id]
+
     if job['status'] != 'completed':
         return jsonify({'error': 'Analysis not complete'}), 400
-    
-    report_path = job['result']['report_path']
-    if not os.path.exists(report_path):
+
+    if not job['result'].get('report_exists'):
         return jsonify({'error': 'Report file not found'}), 404
-    
+
+    report_path = job['result']['report_path']
     return send_file(
         report_path,
         as_attachment=True,
         download_name=f"{job['result']['company_name']}_Analysis_Report.pdf",
-        mimetype='application/pdf'
+        mimetype='application/pdf',
+        conditional=True
     )
 
 
 @app.route('/view/<job_id>')
 def view_report(job_id):
     """View the HTML report"""
-    if job_id not in jobs:
+    job = load_job(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
-    
-    job = jobs[job_id]
+
     if job['status'] != 'completed':
         return jsonify({'error': 'Analysis not complete'}), 400
-    
-    html_path = job['result']['html_path']
-    if not os.path.exists(html_path):
+
+    if not job['result'].get('html_exists'):
         return jsonify({'error': 'Report file not found'}), 404
-    
-    return send_file(html_path)
+
+    html_path = job['result']['html_path']
+
+    # Serve the pre-compressed copy when the client accepts gzip;
+    # conditional=True gives repeat loads a 304 instead of a full body
+    gz_path = html_path + '.gz'
+    if job['result'].get('html_gz_exists') and 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = send_file(gz_path, mimetype='text/html', conditional=True)
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+
+    return send_file(html_path, conditional=True)
 
 
 if __name__ == '__main__':
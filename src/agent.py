@@ -7,6 +7,8 @@ from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
+from jinja2 import Environment, FileSystemLoader
+
 from .config import config
 from .models import PitchDeckAnalysis, InvestorProfile
 from .pdf_parser import PitchDeckParser
@@ -16,6 +18,16 @@ from .question_generator import QuestionGenerator
 from .llm_client import LLMClient
 from .web_search import WebSearchClient
 
+# Report template, compiled once at import time (auto_reload off so Jinja
+# never stats the file again after the first compile)
+_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+    auto_reload=False,
+    cache_size=400,
+)
+_REPORT_TEMPLATE = _JINJA_ENV.get_template("report.html.j2")
+
 
 class SagoPitchVerifier:
     """
@@ -76,26 +88,33 @@ class SagoPitchVerifier:
         self,
         pdf_path: str,
         max_claims: int = 25,
-        max_questions: int = 10
+        max_questions: int = 10,
+        parsed_deck=None
     ) -> PitchDeckAnalysis:
         """
         Perform complete pitch deck analysis.
-        
+
         Args:
             pdf_path: Path to the pitch deck PDF
             max_claims: Maximum claims to verify
             max_questions: Maximum questions to generate
-            
+            parsed_deck: Optional pre-parsed deck (ParsedPitchDeck); when
+                given, the PDF is never reopened — every stage works off
+                the in-memory pages/tables/metadata
+
         Returns:
             Complete PitchDeckAnalysis with all results
         """
         print(f"{'='*60}")
         print(f"🔍 ANALYZING: {pdf_path}")
         print(f"{'='*60}\n")
-        
-        # Step 1: Parse the PDF
+
+        # Step 1: Parse the PDF (exactly once — claim extraction,
+        # verification and question generation all consume this
+        # in-memory structure, never the file)
         print("📄 Step 1: Parsing PDF...")
-        parsed_deck = self.parser.parse(pdf_path)
+        if parsed_deck is None:
+            parsed_deck = self.parser.parse(pdf_path)
         company_name = self.parser.extract_company_name(parsed_deck)
         print(f"   ✓ Company: {company_name}")
         print(f"   ✓ Pages: {parsed_deck.total_pages}")
@@ -242,8 +261,8 @@ Write a professional, balanced summary highlighting the key verification finding
         # Convert HTML to PDF
         pdf_path = "Pitch_Deck_Analysis_Report.pdf"
         try:
-            from weasyprint import HTML
-            HTML(html_path).write_pdf(pdf_path)
+            from .report_renderer import write_pdf_report
+            write_pdf_report(html_path, pdf_path)
             print(f"   ✓ PDF generated: {pdf_path}")
         except ImportError:
             print("   ⚠ WeasyPrint not installed - sending HTML only")
@@ -269,7 +288,7 @@ Write a professional, balanced summary highlighting the key verification finding
             score_color = "#ef4444"
             score_label = "Needs Review"
         
-        # Build claims HTML - grouped by category
+        # Group claims by category for the template
         claims_by_category = {}
         for claim in analysis.extracted_claims:
             cat = claim.category.value.replace('_', ' ').title()
@@ -277,341 +296,15 @@ Write a professional, balanced summary highlighting the key verification finding
                 claims_by_category[cat] = []
             claims_by_category[cat].append(claim.text)
         
-        claims_html = ""
-        for category, claims in claims_by_category.items():
-            claims_html += f'<div class="category-group"><h4>{category}</h4><ul>'
-            for claim in claims:
-                claims_html += f'<li>{claim}</li>'
-            claims_html += '</ul></div>'
-        
-        # Build questions HTML
-        high_priority = [q for q in analysis.generated_questions if q.priority == "high"]
-        medium_priority = [q for q in analysis.generated_questions if q.priority == "medium"]
-        low_priority = [q for q in analysis.generated_questions if q.priority not in ["high", "medium"]]
-        
-        questions_html = ""
-        
-        if high_priority:
-            questions_html += '<div class="priority-section"><h4 class="priority-label high">High Priority</h4>'
-            for i, q in enumerate(high_priority, 1):
-                questions_html += f'''
-                <div class="question-card high">
-                    <div class="question-num">{i}</div>
-                    <div class="question-content">
-                        <p class="question-text">{q.question}</p>
-                        <p class="question-rationale">{q.rationale}</p>
-                    </div>
-                </div>'''
-            questions_html += '</div>'
-        
-        if medium_priority:
-            questions_html += '<div class="priority-section"><h4 class="priority-label medium">Medium Priority</h4>'
-            for i, q in enumerate(medium_priority, len(high_priority) + 1):
-                questions_html += f'''
-                <div class="question-card medium">
-                    <div class="question-num">{i}</div>
-                    <div class="question-content">
-                        <p class="question-text">{q.question}</p>
-                        <p class="question-rationale">{q.rationale}</p>
-                    </div>
-                </div>'''
-            questions_html += '</div>'
-        
-        # Full HTML template - Clean, professional design
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <title>Investment Analysis: {analysis.company_name}</title>
-    <style>
-        @page {{ size: A4; margin: 0; }}
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; 
-            line-height: 1.6; 
-            color: #1e293b; 
-            background: #ffffff;
-        }}
-        
-        .page {{ 
-            max-width: 800px; 
-            margin: 0 auto; 
-            padding: 60px 50px;
-        }}
-        
-        /* Header */
-        .header {{ 
-            border-bottom: 3px solid #1e293b;
-            padding-bottom: 30px;
-            margin-bottom: 40px;
-        }}
-        .header-top {{
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 20px;
-        }}
-        .logo {{
-            font-size: 12px;
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-        }}
-        .date {{
-            font-size: 13px;
-            color: #64748b;
-        }}
-        .company-name {{
-            font-size: 42px;
-            font-weight: 700;
-            color: #0f172a;
-            margin: 10px 0;
-            letter-spacing: -1px;
-        }}
-        .report-type {{
-            font-size: 16px;
-            color: #64748b;
-            font-weight: 400;
-        }}
-        
-        /* Score Section */
-        .score-section {{
-            display: flex;
-            align-items: center;
-            gap: 30px;
-            background: #f8fafc;
-            border-radius: 12px;
-            padding: 25px 30px;
-            margin-bottom: 40px;
-        }}
-        .score-circle {{
-            width: 90px;
-            height: 90px;
-            border-radius: 50%;
-            background: {score_color};
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            flex-shrink: 0;
-        }}
-        .score-value {{
-            font-size: 28px;
-            font-weight: 700;
-            line-height: 1;
-        }}
-        .score-label-small {{
-            font-size: 10px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-top: 4px;
-        }}
-        .score-details h3 {{
-            font-size: 18px;
-            color: #0f172a;
-            margin-bottom: 8px;
-        }}
-        .score-details p {{
-            font-size: 14px;
-            color: #64748b;
-            line-height: 1.5;
-        }}
-        
-        /* Sections */
-        .section {{
-            margin-bottom: 45px;
-        }}
-        .section-title {{
-            font-size: 13px;
-            font-weight: 600;
-            color: #64748b;
-            text-transform: uppercase;
-            letter-spacing: 1.5px;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 1px solid #e2e8f0;
-        }}
-        
-        /* Executive Summary */
-        .summary-text {{
-            font-size: 16px;
-            line-height: 1.8;
-            color: #334155;
-        }}
-        
-        /* Claims */
-        .category-group {{
-            margin-bottom: 25px;
-        }}
-        .category-group h4 {{
-            font-size: 14px;
-            font-weight: 600;
-            color: #0f172a;
-            margin-bottom: 12px;
-        }}
-        .category-group ul {{
-            list-style: none;
-            padding: 0;
-        }}
-        .category-group li {{
-            font-size: 14px;
-            color: #475569;
-            padding: 10px 0 10px 20px;
-            border-left: 2px solid #e2e8f0;
-            margin-bottom: 8px;
-        }}
-        .category-group li:hover {{
-            border-left-color: #3b82f6;
-        }}
-        
-        /* Questions */
-        .priority-section {{
-            margin-bottom: 30px;
-        }}
-        .priority-label {{
-            font-size: 11px;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            padding: 6px 14px;
-            border-radius: 20px;
-            display: inline-block;
-            margin-bottom: 15px;
-        }}
-        .priority-label.high {{
-            background: #fef2f2;
-            color: #dc2626;
-        }}
-        .priority-label.medium {{
-            background: #fffbeb;
-            color: #d97706;
-        }}
-        .question-card {{
-            display: flex;
-            gap: 15px;
-            padding: 20px 0;
-            border-bottom: 1px solid #f1f5f9;
-        }}
-        .question-card:last-child {{
-            border-bottom: none;
-        }}
-        .question-num {{
-            width: 28px;
-            height: 28px;
-            background: #1e293b;
-            color: white;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-            font-weight: 600;
-            flex-shrink: 0;
-        }}
-        .question-card.high .question-num {{
-            background: #dc2626;
-        }}
-        .question-card.medium .question-num {{
-            background: #d97706;
-        }}
-        .question-content {{
-            flex: 1;
-        }}
-        .question-text {{
-            font-size: 15px;
-            font-weight: 500;
-            color: #0f172a;
-            margin-bottom: 8px;
-            line-height: 1.5;
-        }}
-        .question-rationale {{
-            font-size: 13px;
-            color: #64748b;
-            font-style: italic;
-            line-height: 1.5;
-        }}
-        
-        /* Footer */
-        .footer {{
-            margin-top: 60px;
-            padding-top: 30px;
-            border-top: 1px solid #e2e8f0;
-            text-align: center;
-        }}
-        .footer-logo {{
-            font-size: 11px;
-            color: #94a3b8;
-            text-transform: uppercase;
-            letter-spacing: 2px;
-            margin-bottom: 8px;
-        }}
-        .footer-tagline {{
-            font-size: 12px;
-            color: #cbd5e1;
-        }}
-        
-        /* Print styles */
-        @media print {{
-            body {{ -webkit-print-color-adjust: exact; print-color-adjust: exact; }}
-            .page {{ padding: 40px; }}
-            .question-card {{ page-break-inside: avoid; }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="page">
-        <!-- Header -->
-        <div class="header">
-            <div class="header-top">
-                <div class="logo">Sago Investment Analysis</div>
-                <div class="date">{analysis.analysis_timestamp.strftime('%B %d, %Y')}</div>
-            </div>
-            <h1 class="company-name">{analysis.company_name}</h1>
-            <p class="report-type">Pitch Deck Verification Report</p>
-        </div>
-        
-        <!-- Score Section -->
-        <div class="score-section">
-            <div class="score-circle">
-                <span class="score-value">{int(score * 100)}%</span>
-                <span class="score-label-small">Score</span>
-            </div>
-            <div class="score-details">
-                <h3>Verification Status: {score_label}</h3>
-                <p>{len(analysis.extracted_claims)} claims analyzed • {len(analysis.generated_questions)} due diligence questions prepared</p>
-            </div>
-        </div>
-        
-        <!-- Executive Summary -->
-        <div class="section">
-            <h2 class="section-title">Executive Summary</h2>
-            <p class="summary-text">{analysis.executive_summary}</p>
-        </div>
-        
-        <!-- Key Claims -->
-        <div class="section">
-            <h2 class="section-title">Key Claims Identified</h2>
-            {claims_html}
-        </div>
-        
-        <!-- Questions -->
-        <div class="section">
-            <h2 class="section-title">Due Diligence Questions</h2>
-            <p style="font-size: 14px; color: #64748b; margin-bottom: 25px;">
-                The following questions are tailored to your investment focus and designed to probe the key claims made in the pitch deck.
-            </p>
-            {questions_html}
-        </div>
-        
-        <!-- Footer -->
-        <div class="footer">
-            <div class="footer-logo">Sago Pitch Deck Verifier</div>
-            <div class="footer-tagline">AI-Powered Investment Due Diligence</div>
-        </div>
-    </div>
-</body>
-</html>'''
+        html = _REPORT_TEMPLATE.render(
+            analysis=analysis,
+            score=score,
+            score_color=score_color,
+            score_label=score_label,
+            claims_by_category=claims_by_category,
+            high_priority=[q for q in analysis.generated_questions if q.priority == "high"],
+            medium_priority=[q for q in analysis.generated_questions if q.priority == "medium"],
+        )
         
         with open(output_path, 'w') as f:
             f.write(html)
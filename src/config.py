@@ -2,16 +2,23 @@
 Configuration management for Sago Pitch Verifier
 """
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration loaded from environment variables"""
+    """
+    Application configuration loaded from environment variables.
+
+    Frozen + slots: the environment is read once when the module-level
+    instance is created, after which the snapshot is immutable (safe to
+    share across threads) and attribute lookup skips the instance dict.
+    """
     
     # LLM Configuration
     gemini_api_key: Optional[str] = field(default_factory=lambda: os.getenv("GEMINI_API_KEY"))
@@ -41,6 +48,10 @@ class Config:
             raise ValueError("GEMINI_API_KEY must be set in .env file when using gemini provider")
         return True
 
+    def as_mapping(self) -> MappingProxyType:
+        """Read-only mapping view of the settings snapshot"""
+        return MappingProxyType({f.name: getattr(self, f.name) for f in fields(self)})
+
 
 # Global config instance
 config = Config()
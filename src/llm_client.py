@@ -2,9 +2,63 @@
 LLM Client - Abstraction layer for different LLM providers
 Supports: OpenRouter (Gemini 2.5 Flash), Google Gemini, OpenAI, Anthropic
 """
-from typing import Optional, Dict, Any
+import functools
+import hashlib
+from typing import Optional, Dict, Any, List
 from .config import config
 
+try:
+    import orjson  # 2-5x faster JSON parsing for multi-KB LLM outputs
+except ImportError:
+    orjson = None
+
+
+@functools.cache
+def _get_provider_module(name: str):
+    """
+    Import a provider SDK on first use and cache the module object.
+    Keeps heavy imports (gRPC/protobuf for google-generativeai, etc.) off
+    the app boot path -- only the provider actually used ever loads.
+    """
+    import importlib
+    return importlib.import_module(name)
+
+# Content-addressed completion cache, shared by all LLMClient instances.
+# diskcache persists across runs; without it we keep a per-process dict
+# so repeat prompts within one run are still free.
+_prompt_cache = None
+_PROMPT_CACHE_DIR = './.llmcache'
+_PROMPT_CACHE_TTL = 86400  # seconds
+
+
+def _get_prompt_cache():
+    global _prompt_cache
+    if _prompt_cache is None:
+        try:
+            import diskcache
+            _prompt_cache = diskcache.Cache(_PROMPT_CACHE_DIR)
+        except ImportError:
+            _prompt_cache = {}
+    return _prompt_cache
+
+
+def _cache_get(key: str) -> Optional[str]:
+    try:
+        return _get_prompt_cache().get(key)
+    except Exception:
+        return None
+
+
+def _cache_set(key: str, value: str):
+    cache = _get_prompt_cache()
+    try:
+        if isinstance(cache, dict):
+            cache[key] = value
+        else:
+            cache.set(key, value, expire=_PROMPT_CACHE_TTL)
+    except Exception:
+        pass
+
 
 class LLMClient:
     """
@@ -23,88 +77,134 @@ class LLMClient:
         self._initialize_client()
     
     def _initialize_client(self):
-        """Initialize the appropriate LLM client"""
-        
+        """
+        Validate provider configuration. Only API keys are checked here;
+        the provider SDK import and client construction are deferred to
+        the first completion call (see _get_client / _get_session), so
+        app boot doesn't pay for SDKs it never uses.
+        """
+
         if self.provider == "openrouter":
-            try:
-                import requests
-                
-                if not config.openrouter_api_key:
-                    raise ValueError(
-                        "OPENROUTER_API_KEY not set in .env file.\n"
-                        "Get your API key at: https://openrouter.ai/keys"
-                    )
-                
-                # Store API key and base URL for requests-based implementation
-                # Strip whitespace from API key
-                self._openrouter_api_key = (config.openrouter_api_key or "").strip()
-                if not self._openrouter_api_key:
-                    raise ValueError(
-                        "OPENROUTER_API_KEY is empty. Please check your .env file.\n"
-                        "Get your API key at: https://openrouter.ai/keys"
-                    )
-                
-                # Verify API key format
-                if not self._openrouter_api_key.startswith('sk-or-'):
-                    print(f"⚠ Warning: OpenRouter API key should typically start with 'sk-or-'")
-                    print(f"   Your key starts with: {self._openrouter_api_key[:10]}...")
-                
-                self._openrouter_base_url = "https://openrouter.ai/api/v1"
-                self._client = None  # We'll use requests directly
-                
-                print(f"✓ Connected to OpenRouter ({self.model})")
-                print(f"   API key format: {'✓ Valid' if self._openrouter_api_key.startswith('sk-or-') else '⚠ Check format'}")
-                
-            except ImportError:
-                raise ImportError("requests package not installed. Run: pip install requests")
-        
+            if not config.openrouter_api_key:
+                raise ValueError(
+                    "OPENROUTER_API_KEY not set in .env file.\n"
+                    "Get your API key at: https://openrouter.ai/keys"
+                )
+
+            # Store API key and base URL for requests-based implementation
+            # Strip whitespace from API key
+            self._openrouter_api_key = (config.openrouter_api_key or "").strip()
+            if not self._openrouter_api_key:
+                raise ValueError(
+                    "OPENROUTER_API_KEY is empty. Please check your .env file.\n"
+                    "Get your API key at: https://openrouter.ai/keys"
+                )
+
+            # Verify API key format once; completions only consult the flag
+            self._openrouter_key_ok = self._openrouter_api_key.startswith('sk-or-')
+            if not self._openrouter_key_ok:
+                print(f"⚠ Warning: OpenRouter API key should typically start with 'sk-or-'")
+                print(f"   Your key starts with: {self._openrouter_api_key[:10]}...")
+
+            self._openrouter_base_url = "https://openrouter.ai/api/v1"
+            self._openrouter_url = f"{self._openrouter_base_url}/chat/completions"
+            self._openrouter_headers = {
+                "Authorization": f"Bearer {self._openrouter_api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "https://github.com",  # Optional, for tracking
+            }
+            self._session = None  # Built lazily alongside the requests import
+
+            print(f"✓ Connected to OpenRouter ({self.model})")
+            print(f"   API key format: {'✓ Valid' if self._openrouter_key_ok else '⚠ Check format'}")
+
         elif self.provider == "gemini":
+            if not config.gemini_api_key:
+                raise ValueError(
+                    "GEMINI_API_KEY not set in .env file.\n"
+                    "Get your free API key at: https://aistudio.google.com/app/apikey"
+                )
+            print(f"✓ Connected to Gemini ({self.model or 'gemini-1.5-flash'})")
+
+        elif self.provider == "openai":
+            if not config.openai_api_key:
+                raise ValueError("OPENAI_API_KEY not set in .env file.")
+            print(f"✓ Connected to OpenAI ({self.model})")
+
+        elif self.provider == "anthropic":
+            if not config.anthropic_api_key:
+                raise ValueError("ANTHROPIC_API_KEY not set in .env file.")
+            print(f"✓ Connected to Anthropic ({self.model})")
+
+        else:
+            raise ValueError(f"Unsupported LLM provider: {self.provider}")
+
+    def _get_client(self):
+        """Create (or return) the provider SDK client, importing it lazily"""
+        if self._client is not None:
+            return self._client
+
+        if self.provider == "gemini":
             try:
-                import google.generativeai as genai
-                
-                if not config.gemini_api_key:
-                    raise ValueError(
-                        "GEMINI_API_KEY not set in .env file.\n"
-                        "Get your free API key at: https://aistudio.google.com/app/apikey"
-                    )
-                
-                genai.configure(api_key=config.gemini_api_key)
-                self._client = genai.GenerativeModel(self.model or 'gemini-1.5-flash')
-                print(f"✓ Connected to Gemini ({self.model or 'gemini-1.5-flash'})")
-                
+                genai = _get_provider_module("google.generativeai")
             except ImportError:
                 raise ImportError(
                     "Google Generative AI package not installed.\n"
                     "Run: pip install google-generativeai"
                 )
-                
+            genai.configure(api_key=config.gemini_api_key)
+            self._client = genai.GenerativeModel(self.model or 'gemini-1.5-flash')
+
         elif self.provider == "openai":
             try:
-                from openai import OpenAI
-                
-                if not config.openai_api_key:
-                    raise ValueError("OPENAI_API_KEY not set in .env file.")
-                
-                self._client = OpenAI(api_key=config.openai_api_key)
-                print(f"✓ Connected to OpenAI ({self.model})")
-                
+                openai = _get_provider_module("openai")
             except ImportError:
                 raise ImportError("OpenAI package not installed. Run: pip install openai")
-                
+            self._client = openai.OpenAI(api_key=config.openai_api_key)
+
         elif self.provider == "anthropic":
             try:
-                import anthropic
-                
-                if not config.anthropic_api_key:
-                    raise ValueError("ANTHROPIC_API_KEY not set in .env file.")
-                
-                self._client = anthropic.Anthropic(api_key=config.anthropic_api_key)
-                print(f"✓ Connected to Anthropic ({self.model})")
-                
+                anthropic = _get_provider_module("anthropic")
             except ImportError:
                 raise ImportError("Anthropic package not installed. Run: pip install anthropic")
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.provider}")
+            self._client = anthropic.Anthropic(api_key=config.anthropic_api_key)
+
+        return self._client
+
+    def _get_session(self):
+        """Create (or return) the pooled keep-alive session for OpenRouter"""
+        if self._session is None:
+            try:
+                requests = _get_provider_module("requests")
+                adapters = _get_provider_module("requests.adapters")
+            except ImportError:
+                raise ImportError("requests package not installed. Run: pip install requests")
+
+            from urllib3.util.retry import Retry
+
+            # Keep-alive session: every completion reuses the pooled
+            # TCP+TLS connection instead of paying a fresh handshake.
+            # Transient 429/5xx responses retry at the adapter level with
+            # exponential backoff (honoring Retry-After), so one
+            # rate-limit hit doesn't fail a whole claim batch. 401 is
+            # deliberately not retried; it surfaces with diagnostics.
+            retry = Retry(
+                total=5,
+                backoff_factor=1.0,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['POST'],
+                respect_retry_after_header=True
+            )
+            self._session = requests.Session()
+            self._session.mount(
+                "https://",
+                adapters.HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=retry
+                )
+            )
+        return self._session
     
     def complete(
         self, 
@@ -125,16 +225,29 @@ class LLMClient:
         Returns:
             The LLM's response text
         """
+        cache_key = self._cache_key(prompt, system_prompt, temperature, max_tokens)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         if self.provider == "openrouter":
-            return self._openrouter_complete(prompt, system_prompt, temperature, max_tokens)
+            response = self._openrouter_complete(prompt, system_prompt, temperature, max_tokens)
         elif self.provider == "gemini":
-            return self._gemini_complete(prompt, system_prompt, temperature, max_tokens)
+            response = self._gemini_complete(prompt, system_prompt, temperature, max_tokens)
         elif self.provider == "openai":
-            return self._openai_complete(prompt, system_prompt, temperature, max_tokens)
+            response = self._openai_complete(prompt, system_prompt, temperature, max_tokens)
         elif self.provider == "anthropic":
-            return self._anthropic_complete(prompt, system_prompt, temperature, max_tokens)
+            response = self._anthropic_complete(prompt, system_prompt, temperature, max_tokens)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
+
+        _cache_set(cache_key, response)
+        return response
+
+    def _cache_key(self, prompt: str, system_prompt: Optional[str], temperature: float, max_tokens: int) -> str:
+        """Content-addressed key: same inputs -> same cached completion"""
+        raw = f"{self.provider}|{self.model}|{temperature}|{max_tokens}|{system_prompt}|{prompt}"
+        return hashlib.sha256(raw.encode()).hexdigest()
     
     def _gemini_complete(
         self, 
@@ -155,7 +268,7 @@ class LLMClient:
             "max_output_tokens": max_tokens,
         }
         
-        response = self._client.generate_content(
+        response = self._get_client().generate_content(
             full_prompt,
             generation_config=generation_config
         )
@@ -179,24 +292,7 @@ class LLMClient:
             messages.append({"role": "system", "content": system_prompt})
         
         messages.append({"role": "user", "content": prompt})
-        
-        # Ensure API key is set
-        api_key = getattr(self, '_openrouter_api_key', None) or config.openrouter_api_key
-        if not api_key:
-            raise ValueError("OpenRouter API key is not set")
-        
-        api_key = api_key.strip()
-        
-        # Debug: Check API key format (show first/last few chars only)
-        if not api_key.startswith('sk-or-'):
-            print(f"⚠ Warning: OpenRouter API key should typically start with 'sk-or-'. Your key starts with: {api_key[:6]}...")
-        
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com",  # Optional, for tracking
-        }
-        
+
         payload = {
             "model": self.model,
             "messages": messages,
@@ -205,13 +301,13 @@ class LLMClient:
         }
         
         try:
-            response = requests.post(
-                f"{self._openrouter_base_url}/chat/completions",
-                headers=headers,
+            response = self._get_session().post(
+                self._openrouter_url,
+                headers=self._openrouter_headers,
                 json=payload,
                 timeout=60
             )
-            
+
             # Check response before raising
             if response.status_code == 401:
                 error_detail = response.text
@@ -220,12 +316,12 @@ class LLMClient:
                     error_detail = error_json.get('error', {}).get('message', error_detail)
                 except:
                     pass
-                
+
                 raise ValueError(
                     f"OpenRouter API authentication failed (401 Unauthorized).\n"
                     f"Error details: {error_detail}\n"
-                    f"API key format check: {'✓' if api_key.startswith('sk-or-') else '✗ Key should start with sk-or-'}\n"
-                    f"API key length: {len(api_key)} characters\n"
+                    f"API key format check: {'✓' if self._openrouter_key_ok else '✗ Key should start with sk-or-'}\n"
+                    f"API key length: {len(self._openrouter_api_key)} characters\n"
                     f"Please verify:\n"
                     f"  1. Your OPENROUTER_API_KEY in .env is correct\n"
                     f"  2. The key hasn't expired or been revoked\n"
@@ -256,7 +352,7 @@ class LLMClient:
         
         messages.append({"role": "user", "content": prompt})
         
-        response = self._client.chat.completions.create(
+        response = self._get_client().chat.completions.create(
             model=self.model,
             messages=messages,
             temperature=temperature,
@@ -273,7 +369,7 @@ class LLMClient:
         max_tokens: int
     ) -> str:
         """Anthropic Claude API completion"""
-        message = self._client.messages.create(
+        message = self._get_client().messages.create(
             model=self.model if 'claude' in self.model else "claude-3-opus-20240229",
             max_tokens=max_tokens,
             system=system_prompt or "You are a helpful assistant.",
@@ -285,33 +381,165 @@ class LLMClient:
         
         return message.content[0].text
     
-    def complete_with_json(
-        self, 
-        prompt: str, 
-        system_prompt: Optional[str] = None
-    ) -> Dict[str, Any]:
+    def complete_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 2000,
+        max_concurrency: int = 8
+    ) -> List[str]:
         """
-        Generate a completion and parse as JSON.
+        Generate completions for several prompts concurrently.
+
+        For OpenRouter, requests fan out over httpx.AsyncClient with a
+        semaphore bounding in-flight calls, so wall-clock is roughly the
+        slowest call instead of the sum. Other providers (or a missing
+        httpx install) fall back to serial complete() calls.
+
+        Returns:
+            Responses in the same order as prompts
         """
+        # Serve cache hits up front; only misses go over the wire
+        results: List[Optional[str]] = []
+        misses = []
+        miss_slots = []
+        for i, prompt in enumerate(prompts):
+            cached = _cache_get(self._cache_key(prompt, system_prompt, temperature, max_tokens))
+            results.append(cached)
+            if cached is None:
+                misses.append(prompt)
+                miss_slots.append(i)
+
+        if misses and self.provider == "openrouter":
+            try:
+                import asyncio
+                import httpx  # noqa: F401 - checked before starting the loop
+
+                responses = asyncio.run(self._openrouter_complete_many(
+                    misses, system_prompt, temperature, max_tokens, max_concurrency
+                ))
+                # Keep every completion that made it; only the failed
+                # prompts drop to the serial path below (which carries
+                # the session adapter's own retry policy)
+                failed_slots = []
+                for i, response in zip(miss_slots, responses):
+                    if isinstance(response, BaseException):
+                        failed_slots.append(i)
+                        continue
+                    _cache_set(self._cache_key(prompts[i], system_prompt, temperature, max_tokens), response)
+                    results[i] = response
+                if not failed_slots:
+                    return results
+                print(f"   ⚠ {len(failed_slots)}/{len(misses)} batched LLM calls failed, retrying those serially")
+                miss_slots = failed_slots
+            except ImportError:
+                pass
+
+        # complete() handles caching on this path
+        for i in miss_slots:
+            results[i] = self.complete(prompts[i], system_prompt, temperature, max_tokens)
+        return results
+
+    async def _openrouter_complete_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        max_concurrency: int
+    ) -> List[str]:
+        """OpenRouter batch completion over one HTTP/2-capable async client"""
+        import asyncio
+        import httpx
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with httpx.AsyncClient(timeout=60) as client:
+            async def one_completion(prompt: str) -> str:
+                messages = []
+                if system_prompt:
+                    messages.append({"role": "system", "content": system_prompt})
+                messages.append({"role": "user", "content": prompt})
+
+                payload = {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": max_tokens
+                }
+
+                # Same retry policy as the sync session adapter: up to 5
+                # attempts on 429/5xx, honoring Retry-After, otherwise
+                # exponential backoff (1s, 2s, 4s, ...). The semaphore is
+                # held through the sleep so a rate-limited batch slows
+                # down instead of hammering with fresh slots.
+                async with semaphore:
+                    for attempt in range(5):
+                        response = await client.post(
+                            self._openrouter_url,
+                            headers=self._openrouter_headers,
+                            json=payload
+                        )
+                        if response.status_code in (429, 500, 502, 503, 504) and attempt < 4:
+                            retry_after = response.headers.get("Retry-After")
+                            try:
+                                delay = float(retry_after) if retry_after else 2.0 ** attempt
+                            except ValueError:
+                                delay = 2.0 ** attempt
+                            await asyncio.sleep(delay)
+                            continue
+                        response.raise_for_status()
+                        return response.json()["choices"][0]["message"]["content"]
+
+            # return_exceptions keeps one bad prompt from cancelling the
+            # rest of the batch; the caller salvages what succeeded
+            return list(await asyncio.gather(
+                *(one_completion(p) for p in prompts),
+                return_exceptions=True
+            ))
+
+    # Appended to prompts that must come back as machine-readable JSON
+    JSON_INSTRUCTION = "\n\nIMPORTANT: Return ONLY valid JSON, no other text or markdown formatting."
+
+    @staticmethod
+    def extract_json(response: str) -> Dict[str, Any]:
+        """Extract the first JSON object from an LLM response"""
         import json
-        
-        # Add JSON instruction to prompt
-        json_prompt = f"""{prompt}
 
-IMPORTANT: Return ONLY valid JSON, no other text or markdown formatting."""
-        
-        response = self.complete(json_prompt, system_prompt, temperature=0.1)
-        
-        # Clean response
+        # Strip a leading markdown code fence, if any
         response = response.strip()
         if response.startswith('```'):
-            lines = response.split('\n')
-            response = '\n'.join(lines[1:-1] if lines[-1].startswith('```') else lines[1:])
-        
-        # Find JSON in response
+            response = response.split('```', 2)[1]
+            if response.startswith('json'):
+                response = response[4:]
+
+        # Decode the first JSON object in a single pass; raw_decode stops
+        # at the matching close brace, so trailing commentary or stray '}'
+        # characters can't truncate the payload like rfind('}') could
         start = response.find('{')
-        end = response.rfind('}') + 1
-        if start != -1 and end > start:
-            response = response[start:end]
-        
-        return json.loads(response)
+        if start == -1:
+            raise json.JSONDecodeError("No JSON object found in response", response, 0)
+
+        # Fast path: most responses are pure JSON once the fence is gone,
+        # so orjson can parse them outright; messy responses with
+        # trailing commentary fall back to raw_decode
+        if orjson is not None:
+            try:
+                return orjson.loads(response[start:])
+            except orjson.JSONDecodeError:
+                pass
+
+        obj, _ = json.JSONDecoder().raw_decode(response, start)
+        return obj
+
+    def complete_with_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate a completion and parse as JSON.
+        """
+        response = self.complete(prompt + self.JSON_INSTRUCTION, system_prompt, temperature=0.1)
+        return self.extract_json(response)
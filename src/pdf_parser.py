@@ -1,16 +1,160 @@
 """
 PDF Parser for extracting content from pitch decks
 """
+import hashlib
+import io
+import os
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 import pdfplumber
 from PyPDF2 import PdfReader
 
+try:
+    import pypdfium2 as pdfium  # Optional native text backend (10-50x faster than pdfminer)
+except ImportError:
+    pdfium = None
 
-@dataclass
+
+# Canonical section -> keyword table used by extract_sections
+_SECTION_KEYWORDS = {
+    'problem': ['problem', 'challenge', 'pain point'],
+    'solution': ['solution', 'our product', 'how we solve'],
+    'market': ['market', 'tam', 'sam', 'som', 'market size', 'opportunity'],
+    'business_model': ['business model', 'revenue model', 'how we make money', 'monetization'],
+    'traction': ['traction', 'metrics', 'growth', 'customers', 'users'],
+    'competition': ['competition', 'competitive', 'landscape', 'competitors'],
+    'team': ['team', 'founders', 'leadership', 'about us'],
+    'financials': ['financials', 'projections', 'revenue', 'forecast'],
+    'ask': ['ask', 'funding', 'investment', 'raise', 'use of funds'],
+}
+
+
+def _build_section_scan() -> Tuple["re.Pattern[str]", Dict[str, Tuple[str, ...]]]:
+    """
+    Compile one longest-first alternation over every section keyword,
+    plus a map from each keyword to all sections it implies (a longer
+    keyword like "revenue model" also implies sections keyed on its
+    substrings, e.g. "revenue" -> financials).
+    """
+    implies: Dict[str, set] = {}
+    for name, keywords in _SECTION_KEYWORDS.items():
+        for kw in keywords:
+            implies.setdefault(kw, set()).add(name)
+    for kw in implies:
+        for name, keywords in _SECTION_KEYWORDS.items():
+            if any(other != kw and other in kw for other in keywords):
+                implies[kw].add(name)
+    pattern = re.compile("|".join(re.escape(k) for k in sorted(implies, key=len, reverse=True)))
+    return pattern, {kw: tuple(names) for kw, names in implies.items()}
+
+
+_SECTION_RE, _KEYWORD_IMPLIES = _build_section_scan()
+
+
+# Recently parsed decks keyed by (content digest, mtime); retry loops
+# and iterative prompting re-parse the same file, so a small LRU makes
+# those repeat parses free
+_PARSE_CACHE: "OrderedDict[Tuple[str, float], ParsedPitchDeck]" = OrderedDict()
+_PARSE_CACHE_MAX = 16
+
+
+# Parallel extraction tuning: below the threshold, process startup
+# overhead beats the win; above it, pages are split into contiguous
+# chunks so each worker opens the PDF once per chunk
+_PARALLEL_PAGE_THRESHOLD = 10
+_PAGES_PER_CHUNK = 8
+
+
+def _pdfium_page_texts(pdf_src, indices: List[int]) -> Optional[List[str]]:
+    """
+    Fast native text extraction for the given 0-based page indices via
+    pypdfium2.
+
+    pdf_src is a path or the raw PDF bytes. Returns None when the
+    backend is unavailable or errors out, in which case callers fall
+    back to pdfplumber's (much slower) extractor.
+    """
+    if pdfium is None:
+        return None
+    try:
+        doc = pdfium.PdfDocument(pdf_src)
+        try:
+            return [doc[i].get_textpage().get_text_range() or "" for i in indices]
+        finally:
+            doc.close()
+    except Exception:
+        return None
+
+
+def _page_content_dict(page, page_number: int, cleaner,
+                       raw_text: Optional[str] = None,
+                       with_tables: bool = True) -> Dict[str, Any]:
+    """
+    Extract one pdfplumber page into a plain (picklable) dict.
+
+    raw_text may be supplied by a faster backend (pypdfium2); pdfplumber
+    is then only consulted for tables and images, which genuinely need
+    its layout engine. with_tables=False skips the table finder, the
+    most expensive per-page pdfplumber operation.
+    """
+    if raw_text is None:
+        raw_text = page.extract_text() or ""
+    text = cleaner(raw_text)
+
+    tables: List[List[List[str]]] = []
+    if with_tables:
+        try:
+            raw_tables = page.extract_tables()
+            if raw_tables:
+                for table in raw_tables:
+                    cleaned_table = [
+                        [str(cell) if cell is not None else "" for cell in row]
+                        for row in table if row
+                    ]
+                    tables.append(cleaned_table)
+        except Exception:
+            pass
+
+    return {
+        'page_number': page_number,
+        'text': text,
+        'tables': tables,
+        'has_images': bool(getattr(page, "images", []))
+    }
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int,
+                        with_tables: bool = True) -> List[Dict[str, Any]]:
+    """
+    Worker-side extraction of a contiguous page range.
+
+    pdfplumber page objects aren't picklable, so each worker reopens the
+    PDF for its chunk and ships plain dicts back to the parent.
+    """
+    cleaner = PitchDeckParser()._clean_text
+    texts = _pdfium_page_texts(pdf_path, list(range(start, stop)))
+    with pdfplumber.open(pdf_path) as pdf:
+        return [
+            _page_content_dict(
+                pdf.pages[i], i + 1, cleaner,
+                raw_text=texts[i - start] if texts is not None else None,
+                with_tables=with_tables,
+            )
+            for i in range(start, stop)
+        ]
+
+
+@lru_cache(maxsize=256)
+def _occurrence_pattern(needle: str):
+    """Compiled word-boundary pattern for a candidate name"""
+    return re.compile(r"\b" + re.escape(needle) + r"\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class PageContent:
     """Content extracted from a single PDF page"""
     page_number: int
@@ -19,7 +163,7 @@ class PageContent:
     has_images: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPitchDeck:
     """Complete parsed pitch deck"""
     filename: str
@@ -27,13 +171,16 @@ class ParsedPitchDeck:
     pages: List[PageContent]
     metadata: Dict[str, Any]
     full_text: str
+    # Lazily populated caches (slots classes can't grow attributes ad hoc)
+    _pages_by_num: Optional[Dict[int, PageContent]] = field(default=None, repr=False, compare=False)
+    _company_name: Optional[str] = field(default=None, repr=False, compare=False)
 
     def get_text_by_page(self, page_num: int) -> str:
         """Get text for a specific page"""
-        for page in self.pages:
-            if page.page_number == page_num:
-                return page.text
-        return ""
+        if self._pages_by_num is None:
+            self._pages_by_num = {p.page_number: p for p in self.pages}
+        page = self._pages_by_num.get(page_num)
+        return page.text if page else ""
 
 
 class PitchDeckParser:
@@ -67,21 +214,73 @@ class PitchDeckParser:
         "all rights reserved",
     ]
 
+    # All generic substrings folded into one alternation so each
+    # candidate is scanned once instead of once per substring
+    _GENERIC_SUBSTRING_RE = re.compile("|".join(re.escape(s) for s in GENERIC_SUBSTRINGS))
+
+    # Single-pass cleanup table: drop control characters (keep \t and
+    # \n), normalizing \r to \n, all in one C-level translate scan
+    # instead of several regex passes over full page text
+    _TRANSLATE_TABLE = str.maketrans({
+        **{i: None for i in range(0x20) if i not in (0x09, 0x0a)},
+        **{i: None for i in range(0x7f, 0xa0)},
+        0x0d: '\n',  # \r
+    })
+
+    # Precompiled patterns: these run per page / per candidate, where
+    # re's per-call cache lookup and compile step are measurable
+    _MULTI_WS_RE = re.compile(r'[ \t]+')
+    _WHITESPACE_RE = re.compile(r'\s+')
+    # Linguistic-cue probes checked against small slices around each
+    # token during the single scoring pass
+    _WAS_CREATED_TAIL_RE = re.compile(r'\s+was\s+created\b', re.IGNORECASE)
+    _IS_TAIL_RE = re.compile(r'\s+is\b', re.IGNORECASE)
+    _AT_PREFIX_RE = re.compile(r'\bAt\s+$', re.IGNORECASE)
+    _DATEISH_RE = re.compile(r'(\d{4}|\w+\s+\d{4}|\w+\s+\d{1,2},\s*\d{4})')
+    _PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-zA-Z0-9&.\-]{2,}\b')
+    _NONWORD_RE = re.compile(r'[\W_]+')
+    _SHORT_NUMBER_RE = re.compile(r'\d{1,4}')
+
     def __init__(self, llm_client=None):
         """Initialize parser with optional LLM client for company name extraction"""
         self.llm_client = llm_client
         self.supported_formats = ['.pdf']
 
-    def parse(self, pdf_path: str) -> ParsedPitchDeck:
+    def parse(self, pdf_path: str, extract_tables: bool = True,
+              pages: Optional[List[int]] = None) -> ParsedPitchDeck:
         """
         Parse a pitch deck PDF and extract all content.
+
+        Results are cached by content digest, so re-parsing the same
+        deck (retries, iterative prompting) is free. The file is read
+        into memory once and that buffer is shared by every backend
+        instead of each one re-reading from disk.
+
+        extract_tables=False skips pdfplumber's table finder - its most
+        expensive per-page operation - for text-only workflows such as
+        company-name extraction. pages restricts parsing to the given
+        1-based page numbers (e.g. [1, 2, 3, 4, 5] for the early-pages
+        heuristics).
         """
-        pages: List[PageContent] = []
+        try:
+            with open(pdf_path, 'rb') as f:
+                data = f.read()
+            cache_key = (hashlib.sha1(data).hexdigest(), os.path.getmtime(pdf_path),
+                         extract_tables, tuple(pages) if pages else None)
+        except OSError:
+            data = None
+            cache_key = None
+        if cache_key is not None:
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                _PARSE_CACHE.move_to_end(cache_key)
+                return cached
+
         metadata: Dict[str, Any] = {}
 
         # Extract metadata using PyPDF2
         try:
-            reader = PdfReader(pdf_path)
+            reader = PdfReader(io.BytesIO(data) if data is not None else pdf_path)
             if reader.metadata:
                 metadata = {
                     'title': (reader.metadata.get('/Title', '') or '').strip(),
@@ -92,65 +291,145 @@ class PitchDeckParser:
         except Exception as e:
             metadata = {'error': str(e)}
 
-        # Extract content using pdfplumber
-        with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                raw_text = page.extract_text() or ""
-                text = self._clean_text(raw_text)
-
-                # Extract tables
-                tables: List[List[List[str]]] = []
-                try:
-                    raw_tables = page.extract_tables()
-                    if raw_tables:
-                        for table in raw_tables:
-                            cleaned_table = [
-                                [str(cell) if cell is not None else "" for cell in row]
-                                for row in table if row
-                            ]
-                            tables.append(cleaned_table)
-                except Exception:
-                    pass
-
-                has_images = bool(getattr(page, "images", []))
-
-                pages.append(PageContent(
-                    page_number=i + 1,
-                    text=text,
-                    tables=tables,
-                    has_images=has_images
-                ))
-
-                # Capture cover-page "largest text" guess, but we'll validate later
-                if i == 0:
-                    guess = self._company_name_from_largest_text(page)
-                    if guess:
-                        metadata["company_name_guess"] = guess
-
-        full_text = "\n\n".join([p.text for p in pages])
-
-        return ParsedPitchDeck(
+        # Extract content using pdfplumber (from the shared buffer)
+        with pdfplumber.open(io.BytesIO(data) if data is not None else pdf_path) as pdf:
+            total_pages = len(pdf.pages)
+            if pages:
+                indices = [n - 1 for n in pages if 1 <= n <= total_pages]
+            else:
+                indices = list(range(total_pages))
+
+            # Capture cover-page "largest text" guess, but we'll validate later
+            if total_pages:
+                guess = self._company_name_from_largest_text(pdf.pages[0])
+                if guess:
+                    metadata["company_name_guess"] = guess
+
+            # Page subsets are always small enough to stay serial
+            if pages or len(indices) < _PARALLEL_PAGE_THRESHOLD:
+                texts = _pdfium_page_texts(data if data is not None else pdf_path, indices)
+                page_dicts = [
+                    _page_content_dict(
+                        pdf.pages[i], i + 1, self._clean_text,
+                        raw_text=texts[k] if texts is not None else None,
+                        with_tables=extract_tables,
+                    )
+                    for k, i in enumerate(indices)
+                ]
+            else:
+                page_dicts = None
+
+        if page_dicts is None:
+            page_dicts = self._extract_pages_parallel(pdf_path, total_pages, extract_tables)
+
+        # Accumulate full_text while materializing pages instead of a
+        # second join pass that re-copies every page's text
+        page_objects: List[PageContent] = []
+        full_text_buf = io.StringIO()
+        for d in page_dicts:
+            page = PageContent(**d)
+            page_objects.append(page)
+            if full_text_buf.tell():
+                full_text_buf.write('\n\n')
+            full_text_buf.write(page.text)
+        full_text = full_text_buf.getvalue()
+
+        parsed = ParsedPitchDeck(
             filename=pdf_path.split('/')[-1],
-            total_pages=len(pages),
-            pages=pages,
+            total_pages=len(page_objects),
+            pages=page_objects,
             metadata=metadata,
             full_text=full_text
         )
 
-    def _clean_text(self, text: str) -> str:
+        if cache_key is not None:
+            _PARSE_CACHE[cache_key] = parsed
+            while len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+                _PARSE_CACHE.popitem(last=False)
+
+        return parsed
+
+    def iter_pages(self, pdf_path: str, extract_tables: bool = True) -> Iterator[PageContent]:
         """
-        Clean and normalize extracted text while preserving line breaks.
+        Stream pages one at a time without materializing the whole deck.
+
+        parse() holds every page's text and tables in memory before
+        returning, which pdfplumber makes expensive on very long
+        documents. Callers that can fold pages as they go (section
+        detection, text accumulation) consume this iterator instead and
+        keep memory flat regardless of deck size.
+        """
+        try:
+            with open(pdf_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = None
+
+        pdfium_doc = None
+        if pdfium is not None:
+            try:
+                pdfium_doc = pdfium.PdfDocument(data if data is not None else pdf_path)
+            except Exception:
+                pdfium_doc = None
+
+        try:
+            with pdfplumber.open(io.BytesIO(data) if data is not None else pdf_path) as pdf:
+                for i, page in enumerate(pdf.pages):
+                    raw_text = None
+                    if pdfium_doc is not None:
+                        try:
+                            raw_text = pdfium_doc[i].get_textpage().get_text_range() or ""
+                        except Exception:
+                            raw_text = None
+                    yield PageContent(**_page_content_dict(
+                        page, i + 1, self._clean_text,
+                        raw_text=raw_text,
+                        with_tables=extract_tables,
+                    ))
+        finally:
+            if pdfium_doc is not None:
+                pdfium_doc.close()
+
+    def _extract_pages_parallel(self, pdf_path: str, total_pages: int,
+                                extract_tables: bool = True) -> List[Dict[str, Any]]:
         """
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+        Fan contiguous page chunks out to a process pool.
 
-        cleaned_lines: List[str] = []
-        for line in text.split('\n'):
-            line = re.sub(r'[ \t\f\v]+', ' ', line).strip()
-            if line:
-                cleaned_lines.append(line)
+        pdfplumber extraction is CPU-bound (layout analysis per page), so
+        for big decks worker processes beat the GIL-bound serial loop.
+        Falls back to serial extraction if the pool can't start.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        ranges = [
+            (start, min(start + _PAGES_PER_CHUNK, total_pages))
+            for start in range(0, total_pages, _PAGES_PER_CHUNK)
+        ]
+        try:
+            with ProcessPoolExecutor() as executor:
+                chunks = executor.map(
+                    _extract_page_range,
+                    [pdf_path] * len(ranges),
+                    [r[0] for r in ranges],
+                    [r[1] for r in ranges],
+                    [extract_tables] * len(ranges),
+                )
+                # map() preserves submission order, so pages come back in index order
+                return [d for chunk in chunks for d in chunk]
+        except Exception as e:
+            print(f"   ⚠ Parallel page extraction failed ({e}), falling back to serial")
+            return _extract_page_range(pdf_path, 0, total_pages, extract_tables)
+
+    def _clean_text(self, text: str) -> str:
+        """
+        Clean and normalize extracted text while preserving line breaks.
 
-        return "\n".join(cleaned_lines).strip()
+        One translate pass handles control characters and line-ending
+        normalization; one regex pass collapses intra-line whitespace runs.
+        """
+        text = text.translate(self._TRANSLATE_TABLE)
+        text = self._MULTI_WS_RE.sub(' ', text)
+        return "\n".join(filter(None, (line.strip() for line in text.split('\n'))))
 
     def extract_company_name(self, parsed_deck: ParsedPitchDeck) -> str:
         """
@@ -160,21 +439,35 @@ class PitchDeckParser:
         3) Proper-noun frequency across first N pages (good for decks like this Snapchat one)
         4) Metadata (weak)
         5) LLM fallback
+
+        Memoized on the deck object: cached decks get asked repeatedly
+        and the heuristics rescan early pages each time.
         """
-        # Build a small corpus from early pages (where company name typically repeats)
+        cached_name = getattr(parsed_deck, "_company_name", None)
+        if cached_name is not None:
+            return cached_name
+        name = self._extract_company_name_uncached(parsed_deck)
+        parsed_deck._company_name = name
+        return name
+
+    def _extract_company_name_uncached(self, parsed_deck: ParsedPitchDeck) -> str:
+        # Build a small corpus from early pages (where company name typically repeats);
+        # lowercase it once so every candidate check below counts with
+        # plain substring scans instead of IGNORECASE regexes
         early_text = self._get_early_pages_text(parsed_deck, max_pages=5)
+        early_text_lower = early_text.lower()
         filename_hint = parsed_deck.filename
         title_hint = (parsed_deck.metadata.get("title") or "").strip()
 
         # 1) Cover largest-text guess (captured during parse)
         guess = (parsed_deck.metadata.get("company_name_guess") or "").strip()
-        if self._is_valid_company_candidate(guess, early_text):
+        if self._is_valid_company_candidate(guess, early_text_lower):
             return guess
 
         # 2) Cover-page line heuristic
         if parsed_deck.pages:
             cover_candidate = self._company_name_from_cover_text(parsed_deck.pages[0].text)
-            if self._is_valid_company_candidate(cover_candidate, early_text):
+            if self._is_valid_company_candidate(cover_candidate, early_text_lower):
                 return cover_candidate
 
         # 3) Proper-noun frequency heuristic across first pages
@@ -183,19 +476,19 @@ class PitchDeckParser:
             filename_hint=parsed_deck.filename,
             title_hint=(parsed_deck.metadata.get("title") or "")
 )
-        if self._is_valid_company_candidate(freq_candidate, early_text, require_occurrences=1):
+        if self._is_valid_company_candidate(freq_candidate, early_text_lower, require_occurrences=1):
             return freq_candidate
 
         # 4) Metadata fallback (often noisy)
         title = (parsed_deck.metadata.get('title') or '').strip()
-        if self._is_valid_company_candidate(title, early_text, require_occurrences=0):
+        if self._is_valid_company_candidate(title, early_text_lower, require_occurrences=0):
             return title
 
         # 5) LLM fallback
         if self.llm_client:
             try:
                 company_name = self._extract_company_name_with_llm(parsed_deck)
-                if self._is_valid_company_candidate(company_name, early_text, require_occurrences=0):
+                if self._is_valid_company_candidate(company_name, early_text_lower, require_occurrences=0):
                     return company_name
             except Exception as e:
                 print(f"   ⚠ LLM company name extraction failed: {e}")
@@ -209,18 +502,37 @@ class PitchDeckParser:
     def _is_generic_phrase(self, s: str) -> bool:
         if not s:
             return True
-        s_clean = re.sub(r"\s+", " ", s).strip()
+        s_clean = self._WHITESPACE_RE.sub(" ", s).strip()
         if s_clean.upper() in self.GENERIC_COVER_PHRASES:
             return True
-        low = s_clean.lower()
-        return any(sub in low for sub in self.GENERIC_SUBSTRINGS)
+        return self._GENERIC_SUBSTRING_RE.search(s_clean.lower()) is not None
 
-    def _count_occurrences(self, haystack: str, needle: str) -> int:
-        if not haystack or not needle:
+    def _count_occurrences(self, haystack_lower: str, needle: str) -> int:
+        """
+        Count word-boundary occurrences of needle in an already-lowercased
+        haystack. Plain str.find drives the scan (a tight C loop, unlike
+        IGNORECASE regex matching) with boundary checks at each hit; names
+        with non-alphanumeric edges keep the compiled-regex path since \\b
+        semantics differ there.
+        """
+        if not haystack_lower or not needle:
             return 0
-        # Word-boundary-ish match; allows simple brand names to be counted reliably
-        pattern = r"\b" + re.escape(needle) + r"\b"
-        return len(re.findall(pattern, haystack, flags=re.IGNORECASE))
+        needle_lower = needle.lower()
+        if not (needle_lower[0].isalnum() and needle_lower[-1].isalnum()):
+            return len(_occurrence_pattern(needle).findall(haystack_lower))
+
+        count = 0
+        n = len(needle_lower)
+        text_len = len(haystack_lower)
+        idx = haystack_lower.find(needle_lower)
+        while idx != -1:
+            before = haystack_lower[idx - 1] if idx else ''
+            after = haystack_lower[idx + n] if idx + n < text_len else ''
+            if (not before or not (before.isalnum() or before == '_')) and \
+               (not after or not (after.isalnum() or after == '_')):
+                count += 1
+            idx = haystack_lower.find(needle_lower, idx + 1)
+        return count
 
     def _is_plausible_company_name(self, s: str) -> bool:
         s = (s or "").strip()
@@ -230,17 +542,18 @@ class PitchDeckParser:
             return False
         if len(s.split()) > 6:
             return False
-        if re.fullmatch(r"[\W_]+", s):
+        if self._NONWORD_RE.fullmatch(s):
             return False
         # Avoid things that look like dates or slide numbers
-        if re.fullmatch(r"\d{1,4}", s):
+        if self._SHORT_NUMBER_RE.fullmatch(s):
             return False
         return True
 
-    def _is_valid_company_candidate(self, candidate: str, early_text: str, require_occurrences: int = 2) -> bool:
+    def _is_valid_company_candidate(self, candidate: str, early_text_lower: str, require_occurrences: int = 2) -> bool:
         """
         Candidate must be plausible, not generic, and (optionally) show up repeatedly.
         For this Snapchat deck: "FOR BUSINESS" fails generic filter; "Snapchat" passes frequency.
+        Takes the early-pages corpus pre-lowercased so repeated checks share one .lower() pass.
         """
         candidate = (candidate or "").strip()
         if not self._is_plausible_company_name(candidate):
@@ -248,7 +561,7 @@ class PitchDeckParser:
         if self._is_generic_phrase(candidate):
             return False
         if require_occurrences > 0:
-            occ = self._count_occurrences(early_text, candidate)
+            occ = self._count_occurrences(early_text_lower, candidate)
             return occ >= require_occurrences
         return True
 
@@ -266,7 +579,7 @@ class PitchDeckParser:
                 continue
             if self._is_generic_phrase(line):
                 continue
-            if re.fullmatch(r"(\d{4}|\w+\s+\d{4}|\w+\s+\d{1,2},\s*\d{4})", line):
+            if self._DATEISH_RE.fullmatch(line):
                 continue
             if len(line.split()) > 8:
                 continue
@@ -282,32 +595,44 @@ class PitchDeckParser:
         """
         Heuristic: company name is usually the largest text on the cover slide.
         We'll validate against generic phrases + frequency later.
+
+        Works from page.chars directly instead of extract_words: the
+        full word-grouping pass would run over every char on the page,
+        but we only need grouping for the handful of top-size chars.
         """
         try:
-            words = page.extract_words(extra_attrs=["size", "top", "x0"])
+            chars = [c for c in page.chars if (c.get("text") or "").strip()]
         except Exception:
             return None
 
-        if not words:
-            return None
-
-        words = [w for w in words if (w.get("text") or "").strip()]
-        if not words:
+        if not chars:
             return None
 
-        max_size = max((w.get("size", 0) or 0) for w in words)
+        max_size = max((c.get("size", 0) or 0) for c in chars)
         if max_size <= 0:
             return None
 
         tol = 0.92
-        big_words = [w for w in words if (w.get("size", 0) or 0) >= max_size * tol]
-        if not big_words:
+        big_chars = [c for c in chars if (c.get("size", 0) or 0) >= max_size * tol]
+        if not big_chars:
             return None
 
-        big_words = sorted(big_words, key=lambda w: (w.get("top", 0) or 0, w.get("x0", 0) or 0))
-        candidate = " ".join(w["text"] for w in big_words).strip()
-        candidate = re.sub(r"\s+", " ", candidate).strip()
-
+        big_chars = sorted(big_chars, key=lambda c: (c.get("top", 0) or 0, c.get("x0", 0) or 0))
+
+        # Group the size-filtered chars into words: a new line or a gap
+        # wider than ~1.5 char widths becomes a space
+        pieces: List[str] = []
+        prev = None
+        for c in big_chars:
+            if prev is not None:
+                new_line = (c.get("top", 0) or 0) - (prev.get("top", 0) or 0) > 1.0
+                gap = (c.get("x0", 0) or 0) - (prev.get("x1", prev.get("x0", 0)) or 0)
+                if new_line or gap > (prev.get("width", 0) or 0) * 1.5:
+                    pieces.append(" ")
+            pieces.append(c["text"])
+            prev = c
+
+        candidate = self._WHITESPACE_RE.sub(" ", "".join(pieces)).strip()
         return candidate or None
 
     def _company_name_from_proper_noun_frequency(self, early_text: str, filename_hint: str = "", title_hint: str = "") -> str:
@@ -320,13 +645,6 @@ class PitchDeckParser:
         if not early_text:
             return ""
 
-        # Tokens like Snapchat, Evan, Spiegel, America, etc.
-        tokens = re.findall(r"\b[A-Z][a-zA-Z0-9&.\-]{2,}\b", early_text)
-        if not tokens:
-            return ""
-
-        counts = Counter(tokens)
-
         # Common pitch-deck / feature words to avoid as "company"
         blacklist = {
             "Snaps", "Snap", "Stories", "Story",
@@ -335,46 +653,49 @@ class PitchDeckParser:
             "Snap", "SNAP", "FOR", "BUSINESS", "GET", "KNOW", "HISTORY", "OUR"
         }
 
+        # Single streaming pass: accumulate frequency and linguistic-cue
+        # hits for every token at once, probing only the few characters
+        # around each match, instead of rescanning the full corpus for
+        # each of the top-30 candidates afterwards. Cheap one-character
+        # gates skip the cue probes entirely for the common token that
+        # has neither whitespace after it nor "At " before it.
+        stats: Dict[str, List[int]] = {}  # name -> [freq, was_created, at, is]
+        text_len = len(early_text)
+        stats_get = stats.get
+        was_created_match = self._WAS_CREATED_TAIL_RE.match
+        is_match = self._IS_TAIL_RE.match
+        at_search = self._AT_PREFIX_RE.search
+        for m in self._PROPER_NOUN_RE.finditer(early_text):
+            name = m.group()
+            entry = stats_get(name)
+            if entry is None:
+                entry = stats[name] = [0, 0, 0, 0]
+            entry[0] += 1
+
+            start, end = m.span()
+            if end < text_len and early_text[end].isspace():
+                tail = early_text[end:end + 16]
+                if was_created_match(tail):                # "Snapchat was created in 2011"
+                    entry[1] = 1
+                elif is_match(tail):                       # "Snapchat is ..."
+                    entry[3] = 1
+            if start and early_text[start - 1].isspace():
+                if at_search(early_text[max(0, start - 8):start]):  # "At Snapchat, ..."
+                    entry[2] = 1
+
+        if not stats:
+            return ""
+
         # Normalize hints
         filename_low = (filename_hint or "").lower()
         title_low = (title_hint or "").lower()
 
-        # Pattern bonuses that strongly indicate a company name
-        def pattern_bonus(name: str) -> int:
-            n = re.escape(name)
-            bonus = 0
-            # e.g., "Snapchat was created in 2011"
-            if re.search(rf"\b{n}\b\s+was\s+created\b", early_text, flags=re.IGNORECASE):
-                bonus += 8
-            # e.g., "At Snapchat, ..."
-            if re.search(rf"\bAt\s+{n}\b", early_text, flags=re.IGNORECASE):
-                bonus += 5
-            # e.g., "Snapchat is ..."
-            if re.search(rf"\b{n}\b\s+is\b", early_text, flags=re.IGNORECASE):
-                bonus += 3
-            return bonus
-
-        def hint_bonus(name: str) -> int:
-            bonus = 0
-            low = name.lower()
-            # Filename match is very strong (e.g., Snapchat_PitchDeck.pdf)
-            if low and low in filename_low:
-                bonus += 10
-            # Title match is moderate
-            if low and low in title_low:
-                bonus += 4
-            return bonus
-
-        def plural_penalty(name: str) -> int:
-            # Penalize simple plural feature words (Snaps/Stories/etc.)
-            # Keep penalty small so real brands like "Vans" aren't automatically killed.
-            return 2 if name.endswith("s") else 0
-
         best_name = ""
         best_score = -10**9
 
         # Consider top candidates by raw frequency
-        for name, freq in counts.most_common(30):
+        top = sorted(stats.items(), key=lambda kv: kv[1][0], reverse=True)[:30]
+        for name, (freq, was_created, at_hit, is_hit) in top:
             if name in blacklist:
                 continue
             if not self._is_plausible_company_name(name):
@@ -382,11 +703,19 @@ class PitchDeckParser:
             if self._is_generic_phrase(name):
                 continue
 
-            score = 0
-            score += freq * 2                      # frequency weight
-            score += pattern_bonus(name)           # linguistic cues
-            score += hint_bonus(name)              # filename/title cues
-            score -= plural_penalty(name)          # mild plural penalty
+            low = name.lower()
+            score = freq * 2                               # frequency weight
+            score += 8 * was_created + 5 * at_hit + 3 * is_hit
+            # Filename match is very strong (e.g., Snapchat_PitchDeck.pdf)
+            if low in filename_low:
+                score += 10
+            # Title match is moderate
+            if low in title_low:
+                score += 4
+            # Mild plural penalty (Snaps/Stories) without killing real
+            # brands like "Vans"
+            if name.endswith("s"):
+                score -= 2
 
             if score > best_score:
                 best_score = score
@@ -424,21 +753,39 @@ What is the name of the company this pitch deck is for? Return only the company
         """
         Identify common pitch deck sections (presence/absence).
         """
-        sections: Dict[str, bool] = {}
-        section_keywords = {
-            'problem': ['problem', 'challenge', 'pain point'],
-            'solution': ['solution', 'our product', 'how we solve'],
-            'market': ['market', 'tam', 'sam', 'som', 'market size', 'opportunity'],
-            'business_model': ['business model', 'revenue model', 'how we make money', 'monetization'],
-            'traction': ['traction', 'metrics', 'growth', 'customers', 'users'],
-            'competition': ['competition', 'competitive', 'landscape', 'competitors'],
-            'team': ['team', 'founders', 'leadership', 'about us'],
-            'financials': ['financials', 'projections', 'revenue', 'forecast'],
-            'ask': ['ask', 'funding', 'investment', 'raise', 'use of funds'],
-        }
+        return self._scan_sections([parsed_deck.full_text or ""])
+
+    def extract_sections_from_file(self, pdf_path: str) -> Dict[str, bool]:
+        """
+        Section detection straight from a file via the page stream.
+
+        Skips table extraction and never materializes the deck, so it
+        runs in flat memory on arbitrarily long documents and stops
+        reading as soon as every section has been seen.
+        """
+        return self._scan_sections(
+            page.text for page in self.iter_pages(pdf_path, extract_tables=False)
+        )
 
-        full_text_lower = (parsed_deck.full_text or "").lower()
-        for section_name, keywords in section_keywords.items():
-            sections[section_name] = any(keyword in full_text_lower for keyword in keywords)
+    @staticmethod
+    def _scan_sections(texts: Iterable[str]) -> Dict[str, bool]:
+        """
+        One pass of the combined keyword alternation over each text chunk
+        instead of an independent substring scan per keyword, stopping
+        early once every section has been seen.
+        """
+        sections = {name: False for name in _SECTION_KEYWORDS}
+        remaining = len(sections)
+
+        for text in texts:
+            for m in _SECTION_RE.finditer(text.lower()):
+                for name in _KEYWORD_IMPLIES[m.group()]:
+                    if not sections[name]:
+                        sections[name] = True
+                        remaining -= 1
+                if not remaining:
+                    break
+            if not remaining:
+                break
 
         return sections
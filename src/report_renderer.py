@@ -0,0 +1,64 @@
+"""
+PDF Report Renderer - Converts HTML reports to PDF via WeasyPrint
+
+Rendering is CPU-bound (layout dominates), so it runs in a small process
+pool: concurrent jobs render on separate cores instead of serializing on
+the GIL inside the analysis thread. Each worker process keeps a single
+FontConfiguration alive so font discovery and Pango/Cairo setup happen
+once per worker instead of on every report. The report stylesheet is
+inlined in the generated HTML, so there are no external CSS files to
+pre-parse.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared within each process; created lazily so importing this module
+# doesn't require WeasyPrint to be installed
+_font_config = None
+
+# Dedicated render pool, created on first use
+_pdf_pool = None
+
+
+def _get_font_config():
+    """Get (or create) the process-wide WeasyPrint FontConfiguration"""
+    global _font_config
+    if _font_config is None:
+        from weasyprint.text.fonts import FontConfiguration
+        _font_config = FontConfiguration()
+    return _font_config
+
+
+def _get_pdf_pool():
+    """Get (or create) the shared PDF render pool"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pdf_pool
+
+
+def _render_to_pdf(html_path: str, pdf_path: str) -> str:
+    """Worker-side render: layout via render(), then serialize the document"""
+    from weasyprint import HTML
+
+    # encoding is explicit so WeasyPrint never falls back to charset
+    # detection; these are internal analyst reports, so skip the
+    # presentational-hints pass and the font/image re-encoding passes
+    document = HTML(html_path, encoding='utf-8').render(
+        font_config=_get_font_config(),
+        presentational_hints=False,
+        optimize_size=(),
+    )
+    document.write_pdf(pdf_path)
+    return pdf_path
+
+
+def write_pdf_report(html_path: str, pdf_path: str) -> str:
+    """
+    Render an HTML report file to PDF on the render pool and wait for it.
+
+    Raises ImportError if WeasyPrint is not installed (surfaced from the
+    worker); callers decide how to degrade (skip the PDF, send HTML
+    instead, etc.).
+    """
+    return _get_pdf_pool().submit(_render_to_pdf, html_path, pdf_path).result()
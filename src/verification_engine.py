@@ -43,14 +43,43 @@ class VerificationEngine:
             List of VerifiedClaim with verification results
         """
         verified_claims = []
-        
+
         # Limit to top 12 claims to reduce API calls
         claims_to_verify = claims[:12]
-        
-        for i, claim in enumerate(claims_to_verify):
-            print(f"   Verifying claim {i+1}/{len(claims_to_verify)}: {claim.text[:50]}...")
-            verified = self.verify_single_claim(claim, company_name)
-            verified_claims.append(verified)
+
+        # Gather evidence for all claims at once: queries are independent
+        # and latency-bound, so they fan out through the search client's
+        # thread pool (DuckDuckGo still serializes via its rate-limit
+        # lock). The LLM analysis calls are then batched as well.
+        query_lists = [
+            self._generate_search_queries(claim, company_name)[:1]  # Just 1 query per claim
+            for claim in claims_to_verify
+        ]
+        flat_queries = [q for queries in query_lists for q in queries]
+        if flat_queries:
+            print(f"   Gathering evidence for {len(claims_to_verify)} claims ({len(flat_queries)} searches)...")
+        flat_results = iter(self.search.search_batch(flat_queries))
+
+        evidence_per_claim = []
+        for claim, queries in zip(claims_to_verify, query_lists):
+            all_evidence = []
+            for _ in queries:
+                all_evidence.extend(self._process_search_results(next(flat_results), claim))
+            evidence_per_claim.append(all_evidence)
+
+        if claims_to_verify:
+            print(f"   Analyzing {len(claims_to_verify)} claims (batched LLM calls)...")
+        analyses = self._analyze_evidence_batch(claims_to_verify, evidence_per_claim, company_name)
+
+        for claim, evidence, analysis in zip(claims_to_verify, evidence_per_claim, analyses):
+            verified_claims.append(VerifiedClaim(
+                claim=claim,
+                status=analysis['status'],
+                evidence=evidence[:5],  # Keep top 5 evidence pieces
+                verification_summary=analysis['summary'],
+                confidence_score=analysis['confidence'],
+                red_flags=analysis.get('red_flags', [])
+            ))
         
         # Add remaining claims as unverified
         for claim in claims[5:]:
@@ -224,29 +253,37 @@ class VerificationEngine:
         
         return True
     
-    def _analyze_evidence(
-        self, 
-        claim: ExtractedClaim, 
+    def _no_evidence_result(self) -> Dict[str, Any]:
+        """Verdict used when web search turned up nothing relevant"""
+        return {
+            'status': VerificationStatus.UNABLE_TO_VERIFY,
+            'summary': "No relevant evidence found through web search. This claim could not be independently verified.",
+            'confidence': 0.2,
+            'red_flags': ["No external sources found to verify this claim"]
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Verdict used when the LLM analysis itself failed"""
+        return {
+            'status': VerificationStatus.UNABLE_TO_VERIFY,
+            'summary': f"Error during verification analysis: {str(error)}",
+            'confidence': 0.3,
+            'red_flags': ["Automated verification encountered an error"]
+        }
+
+    def _build_analysis_prompt(
+        self,
+        claim: ExtractedClaim,
         evidence: List[VerificationEvidence],
         company_name: str
-    ) -> Dict[str, Any]:
-        """Use LLM to synthesize evidence and produce verification verdict"""
-        
-        if not evidence:
-            return {
-                'status': VerificationStatus.UNABLE_TO_VERIFY,
-                'summary': "No relevant evidence found through web search. This claim could not be independently verified.",
-                'confidence': 0.2,
-                'red_flags': ["No external sources found to verify this claim"]
-            }
-        
-        # Prepare evidence summary for LLM
+    ) -> str:
+        """Build the evidence-synthesis prompt for a claim"""
         evidence_text = "\n".join([
             f"Source: {e.source_name}\nURL: {e.source_url}\nContent: {e.snippet}\n"
             for e in evidence[:5]
         ])
-        
-        prompt = f"""Analyze the following claim from {company_name}'s pitch deck and the evidence found:
+
+        return f"""Analyze the following claim from {company_name}'s pitch deck and the evidence found:
 
 CLAIM: {claim.text}
 CLAIM CATEGORY: {claim.category.value}
@@ -264,32 +301,86 @@ Based on the evidence, provide a verification analysis in JSON format:
 
 Be rigorous - only mark as "verified" if there's strong corroborating evidence.
 """
-        
+
+    def _parse_analysis_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a parsed LLM verdict onto verification fields"""
+        status_map = {
+            'verified': VerificationStatus.VERIFIED,
+            'partially_verified': VerificationStatus.PARTIALLY_VERIFIED,
+            'unverified': VerificationStatus.UNVERIFIED,
+            'contradicted': VerificationStatus.CONTRADICTED,
+            'unable_to_verify': VerificationStatus.UNABLE_TO_VERIFY,
+        }
+
+        return {
+            'status': status_map.get(response.get('status', 'unable_to_verify'), VerificationStatus.UNABLE_TO_VERIFY),
+            'summary': response.get('summary', 'Verification analysis completed.'),
+            'confidence': float(response.get('confidence', 0.5)),
+            'red_flags': response.get('red_flags', [])
+        }
+
+    def _analyze_evidence(
+        self,
+        claim: ExtractedClaim,
+        evidence: List[VerificationEvidence],
+        company_name: str
+    ) -> Dict[str, Any]:
+        """Use LLM to synthesize evidence and produce verification verdict"""
+
+        if not evidence:
+            return self._no_evidence_result()
+
         try:
-            response = self.llm.complete_with_json(prompt)
-            
-            status_map = {
-                'verified': VerificationStatus.VERIFIED,
-                'partially_verified': VerificationStatus.PARTIALLY_VERIFIED,
-                'unverified': VerificationStatus.UNVERIFIED,
-                'contradicted': VerificationStatus.CONTRADICTED,
-                'unable_to_verify': VerificationStatus.UNABLE_TO_VERIFY,
-            }
-            
-            return {
-                'status': status_map.get(response.get('status', 'unable_to_verify'), VerificationStatus.UNABLE_TO_VERIFY),
-                'summary': response.get('summary', 'Verification analysis completed.'),
-                'confidence': float(response.get('confidence', 0.5)),
-                'red_flags': response.get('red_flags', [])
-            }
-            
+            response = self.llm.complete_with_json(
+                self._build_analysis_prompt(claim, evidence, company_name)
+            )
+            return self._parse_analysis_response(response)
         except Exception as e:
-            return {
-                'status': VerificationStatus.UNABLE_TO_VERIFY,
-                'summary': f"Error during verification analysis: {str(e)}",
-                'confidence': 0.3,
-                'red_flags': ["Automated verification encountered an error"]
-            }
+            return self._error_result(e)
+
+    def _analyze_evidence_batch(
+        self,
+        claims: List[ExtractedClaim],
+        evidence_per_claim: List[List[VerificationEvidence]],
+        company_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze many claims' evidence with concurrent LLM calls.
+
+        Claims without evidence are settled locally; the rest go through
+        LLMClient.complete_many in one batch. Falls back to per-claim
+        analysis if the batch call fails outright.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(claims)
+
+        prompts = []
+        slots = []
+        for i, (claim, evidence) in enumerate(zip(claims, evidence_per_claim)):
+            if not evidence:
+                results[i] = self._no_evidence_result()
+            else:
+                prompts.append(self._build_analysis_prompt(claim, evidence, company_name))
+                slots.append(i)
+
+        if prompts:
+            try:
+                responses = self.llm.complete_many(
+                    [p + self.llm.JSON_INSTRUCTION for p in prompts],
+                    temperature=0.1
+                )
+            except Exception as e:
+                print(f"   ⚠ Batched analysis failed ({str(e)[:100]}), retrying claims one by one...")
+                for i in slots:
+                    results[i] = self._analyze_evidence(claims[i], evidence_per_claim[i], company_name)
+                return results
+
+            for i, response in zip(slots, responses):
+                try:
+                    results[i] = self._parse_analysis_response(self.llm.extract_json(response))
+                except Exception as e:
+                    results[i] = self._error_result(e)
+
+        return results
     
     def calculate_overall_score(self, verified_claims: List[VerifiedClaim]) -> float:
         """Calculate overall verification score for the pitch deck"""
@@ -2,8 +2,10 @@
 Web Search Client - Searches the web for verification evidence
 Supports Tavily (free tier: 1,000 searches/month) with DuckDuckGo fallback
 """
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from .config import config
 
@@ -14,11 +16,28 @@ class WebSearchClient:
     - Tavily (primary): Free tier with 1,000 searches/month, no rate limits
     - DuckDuckGo (fallback): Free but has rate limits
     """
-    
+
     # Class-level rate limiter for DuckDuckGo
     _last_ddg_search_time = 0
     _min_ddg_delay = 2.5  # Minimum seconds between DuckDuckGo searches
-    
+
+    # Shared provider clients: both Tavily and DDGS keep HTTP sessions
+    # alive internally, so reusing one instance across WebSearchClient
+    # objects keeps connections warm instead of re-handshaking TLS on
+    # every search
+    _shared_tavily = None
+    _shared_ddg = None
+    _client_lock = threading.Lock()
+
+    # Serializes concurrent DuckDuckGo searches so the class-level rate
+    # limiter stays honest when search_batch fans out across threads
+    _ddg_rate_lock = threading.Lock()
+
+    # Small LRU of recent results: verification loops often re-ask the
+    # same query within one analysis
+    _result_cache: "OrderedDict[Tuple[str, int], List[Dict[str, Any]]]" = OrderedDict()
+    _result_cache_max = 512
+
     def __init__(self, max_results: int = 5, provider: Optional[str] = None):
         self.max_results = max_results
         self.provider = provider or config.search_provider.lower()
@@ -26,14 +45,13 @@ class WebSearchClient:
         self._ddg = None
         self._initialized = False
         self._use_tavily = False
-        
+
         # Try to initialize Tavily first if API key is available
         if config.tavily_api_key:
             try:
-                from tavily import TavilyClient
-                self._tavily_client = TavilyClient(api_key=config.tavily_api_key)
-                self._use_tavily = True
-                if not self._initialized:
+                self._tavily_client = self._get_tavily_client()
+                self._use_tavily = self._tavily_client is not None
+                if self._use_tavily and not self._initialized:
                     print("✓ Web search ready (Tavily - Free tier: 1,000 searches/month)")
                     self._initialized = True
             except ImportError:
@@ -41,41 +59,69 @@ class WebSearchClient:
                 print("   Install with: pip install tavily-python")
             except Exception as e:
                 print(f"⚠ Tavily initialization failed: {e}, falling back to DuckDuckGo")
-        
+
         # Fallback to DuckDuckGo if Tavily not available
         if not self._use_tavily:
             if not self._initialized:
                 print("✓ Web search ready (DuckDuckGo - Free, but has rate limits)")
                 self._initialized = True
-    
+
     def _get_tavily_client(self):
-        """Initialize Tavily client"""
-        if self._tavily_client is None and config.tavily_api_key:
-            try:
-                from tavily import TavilyClient
-                self._tavily_client = TavilyClient(api_key=config.tavily_api_key)
-            except ImportError:
-                raise ImportError(
-                    "tavily-python package not installed.\n"
-                    "Run: pip install tavily-python\n"
-                    "Get free API key at: https://tavily.com"
-                )
-            except Exception as e:
-                raise Exception(f"Tavily initialization failed: {e}")
-        return self._tavily_client
-    
+        """Initialize (or reuse) the shared Tavily client"""
+        cls = WebSearchClient
+        if cls._shared_tavily is None and config.tavily_api_key:
+            with cls._client_lock:
+                if cls._shared_tavily is None:
+                    try:
+                        from tavily import TavilyClient
+                        cls._shared_tavily = TavilyClient(api_key=config.tavily_api_key)
+                    except ImportError:
+                        raise ImportError(
+                            "tavily-python package not installed.\n"
+                            "Run: pip install tavily-python\n"
+                            "Get free API key at: https://tavily.com"
+                        )
+                    except Exception as e:
+                        raise Exception(f"Tavily initialization failed: {e}")
+        return cls._shared_tavily
+
     def _get_ddg_client(self):
-        """Initialize DuckDuckGo client"""
-        if self._ddg is None:
-            try:
-                from duckduckgo_search import DDGS
-                self._ddg = DDGS()
-            except ImportError:
-                raise ImportError(
-                    "duckduckgo-search package not installed.\n"
-                    "Run: pip install duckduckgo-search"
-                )
-        return self._ddg
+        """Initialize (or reuse) the shared DuckDuckGo client"""
+        cls = WebSearchClient
+        if cls._shared_ddg is None:
+            with cls._client_lock:
+                if cls._shared_ddg is None:
+                    try:
+                        from duckduckgo_search import DDGS
+                        cls._shared_ddg = DDGS()
+                    except ImportError:
+                        raise ImportError(
+                            "duckduckgo-search package not installed.\n"
+                            "Run: pip install duckduckgo-search"
+                        )
+        return cls._shared_ddg
+
+    @classmethod
+    def _reset_ddg_client(cls):
+        """Drop the shared DDG client so the next search reconnects"""
+        with cls._client_lock:
+            cls._shared_ddg = None
+
+    @classmethod
+    def _cache_get(cls, key: Tuple[str, int]) -> Optional[List[Dict[str, Any]]]:
+        with cls._client_lock:
+            results = cls._result_cache.get(key)
+            if results is not None:
+                cls._result_cache.move_to_end(key)
+                return list(results)
+        return None
+
+    @classmethod
+    def _cache_put(cls, key: Tuple[str, int], results: List[Dict[str, Any]]):
+        with cls._client_lock:
+            cls._result_cache[key] = list(results)
+            while len(cls._result_cache) > cls._result_cache_max:
+                cls._result_cache.popitem(last=False)
     
     def search(self, query: str, retry_count: int = 2) -> List[Dict[str, Any]]:
         """
@@ -89,17 +135,49 @@ class WebSearchClient:
         Returns:
             List of search results with url, title, snippet, source
         """
+        cache_key = (query, self.max_results)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        results: List[Dict[str, Any]] = []
+
         # Try Tavily first if available
         if self._use_tavily and config.tavily_api_key:
             try:
-                return self._search_tavily(query)
+                results = self._search_tavily(query)
             except Exception as e:
                 print(f"   ⚠ Tavily search failed: {str(e)[:100]}, trying DuckDuckGo...")
                 self._use_tavily = False  # Disable Tavily for this session
-        
+
         # Fallback to DuckDuckGo
-        return self._search_duckduckgo(query, retry_count)
+        if not results and not self._use_tavily:
+            results = self._search_duckduckgo(query, retry_count)
+
+        # Only cache real answers; empty results may just mean a flaky provider
+        if results:
+            self._cache_put(cache_key, results)
+        return results
     
+    def search_batch(self, queries: List[str], max_workers: int = 8) -> List[List[Dict[str, Any]]]:
+        """
+        Run independent searches concurrently.
+
+        Each search is dominated by network round-trip time, so a small
+        thread pool gets near-linear speedup with Tavily; DuckDuckGo
+        calls still serialize politely through the rate-limit lock.
+        Results come back in the same order as the queries.
+        """
+        if not queries:
+            return []
+        if len(queries) == 1:
+            return [self.search(queries[0])]
+
+        from concurrent.futures import ThreadPoolExecutor
+        workers = min(max_workers, len(queries))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.search, queries))
+
     def _search_tavily(self, query: str) -> List[Dict[str, Any]]:
         """Search using Tavily API"""
         client = self._get_tavily_client()
@@ -134,20 +212,27 @@ class WebSearchClient:
         """Search using DuckDuckGo with rate limiting"""
         for attempt in range(retry_count + 1):
             try:
-                # Rate limiting: ensure minimum delay since last search
-                current_time = time.time()
-                time_since_last = current_time - WebSearchClient._last_ddg_search_time
-                if time_since_last < WebSearchClient._min_ddg_delay:
-                    wait_needed = WebSearchClient._min_ddg_delay - time_since_last
-                    time.sleep(wait_needed)
-                
-                # Additional delay for retries
-                if attempt > 0:
-                    time.sleep(3.0)  # Extra 3 seconds between retries
-                
-                ddg = self._get_ddg_client()
-                results = list(ddg.text(query, max_results=self.max_results))
-                
+                with WebSearchClient._ddg_rate_lock:
+                    # Rate limiting: ensure minimum delay since last search
+                    current_time = time.time()
+                    time_since_last = current_time - WebSearchClient._last_ddg_search_time
+                    if time_since_last < WebSearchClient._min_ddg_delay:
+                        wait_needed = WebSearchClient._min_ddg_delay - time_since_last
+                        time.sleep(wait_needed)
+
+                    # Additional delay for retries
+                    if attempt > 0:
+                        time.sleep(3.0)  # Extra 3 seconds between retries
+
+                    ddg = self._get_ddg_client()
+                    results = list(ddg.text(query, max_results=self.max_results))
+
+                    # Update last search time
+                    WebSearchClient._last_ddg_search_time = time.time()
+
+                    # Small delay after successful search to be respectful
+                    time.sleep(0.5)
+
                 processed_results = []
                 for result in results:
                     processed_results.append({
@@ -157,12 +242,7 @@ class WebSearchClient:
                         'source': self._extract_source(result.get('href', '')),
                         'timestamp': datetime.now().isoformat()
                     })
-                
-                # Update last search time
-                WebSearchClient._last_ddg_search_time = time.time()
-                
-                # Small delay after successful search to be respectful
-                time.sleep(0.5)
+
                 return processed_results
                 
             except Exception as e:
@@ -171,12 +251,13 @@ class WebSearchClient:
                     wait_time = (attempt + 1) * 5  # Longer exponential backoff: 5s, 10s, 15s
                     print(f"   ⏳ Rate limited, waiting {wait_time}s before retry...")
                     time.sleep(wait_time)
-                    self._ddg = None  # Reset client to get fresh connection
+                    self._reset_ddg_client()  # 429s sometimes clear with a fresh connection
                 elif 'timeout' in error_str or 'connection' in error_str:
                     wait_time = (attempt + 1) * 3
                     print(f"   ⏳ Connection issue, waiting {wait_time}s...")
                     time.sleep(wait_time)
-                    self._ddg = None
+                    # Keep the client (and its warm connection pool); the
+                    # retry itself re-establishes anything that dropped
                 else:
                     if attempt == retry_count:
                         print(f"   ⚠ Search failed after {retry_count} retries: {str(e)[:100]}")
@@ -1,5 +1,6 @@
 let currentJobId = null;
 let statusCheckInterval = null;
+let eventSource = null;
 
 document.getElementById('file').addEventListener('change', function(e) {
     const fileName = e.target.files[0]?.name;
@@ -57,38 +58,71 @@ document.getElementById('upload-form').addEventListener('submit', async function
 });
 
 function startStatusCheck() {
-    if (statusCheckInterval) {
-        clearInterval(statusCheckInterval);
+    stopStatusCheck();
+
+    // Prefer Server-Sent Events: the server pushes one update per real
+    // state change instead of us polling every 2 seconds
+    if (window.EventSource) {
+        eventSource = new EventSource(`/events/${currentJobId}`);
+
+        eventSource.onmessage = (event) => {
+            handleStatusUpdate(JSON.parse(event.data));
+        };
+
+        eventSource.onerror = () => {
+            // Stream dropped (proxy timeout, old server) - fall back to polling
+            stopStatusCheck();
+            startStatusPolling();
+        };
+    } else {
+        startStatusPolling();
     }
-    
+}
+
+function startStatusPolling() {
     statusCheckInterval = setInterval(async () => {
         if (!currentJobId) return;
-        
+
         try {
             const response = await fetch(`/status/${currentJobId}`);
             const data = await response.json();
-            
+
             if (!response.ok) {
                 throw new Error(data.error || 'Status check failed');
             }
-            
-            updateProgress(data.progress, data.message);
-            
-            if (data.status === 'completed') {
-                clearInterval(statusCheckInterval);
-                showResults(data.result);
-            } else if (data.status === 'error') {
-                clearInterval(statusCheckInterval);
-                showError(data.error || 'Analysis failed');
-            }
-            
+
+            handleStatusUpdate(data);
+
         } catch (error) {
-            clearInterval(statusCheckInterval);
+            stopStatusCheck();
             showError(error.message);
         }
     }, 2000); // Check every 2 seconds
 }
 
+function handleStatusUpdate(data) {
+    updateProgress(data.progress, data.message);
+
+    if (data.status === 'completed') {
+        stopStatusCheck();
+        showResults(data.result);
+    } else if (data.status === 'error') {
+        stopStatusCheck();
+        showError(data.error || 'Analysis failed');
+    }
+}
+
+function stopStatusCheck() {
+    if (statusCheckInterval) {
+        clearInterval(statusCheckInterval);
+        statusCheckInterval = null;
+    }
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+}
+
 function updateProgress(progress, message) {
     const progressFill = document.getElementById('progress-fill');
     const progressText = document.getElementById('progress-text');
@@ -155,11 +189,8 @@ function resetButton() {
 
 function cancelAndReset() {
     // Stop status checking
-    if (statusCheckInterval) {
-        clearInterval(statusCheckInterval);
-        statusCheckInterval = null;
-    }
-    
+    stopStatusCheck();
+
     // Reset form
     resetForm();
 }
@@ -176,12 +207,9 @@ function resetForm() {
     document.getElementById('progress-fill').style.width = '0%';
     document.getElementById('progress-text').textContent = '0%';
     document.getElementById('progress-message').textContent = 'Starting analysis...';
-    
-    if (statusCheckInterval) {
-        clearInterval(statusCheckInterval);
-        statusCheckInterval = null;
-    }
-    
+
+    stopStatusCheck();
+
     currentJobId = null;
     resetButton();
 }